@@ -6,10 +6,13 @@ from typing import Any, Dict, Optional
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class CommandResult:
     """Result object returned by pipeline commands.
 
+    One instance is produced per pipeline step, so it uses slots and skips the
+    generated __eq__/__repr__, which nothing relies on.
+
     Attributes:
         return_code: 0 for success, negative to halt pipeline, positive to warn and continue
         data: The DataFrame to pass to next command (None if error and halting)
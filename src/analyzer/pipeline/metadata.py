@@ -1,16 +1,38 @@
 """Metadata collection and persistence for pipeline and steps."""
 
-import json
+import os
+import time
 import uuid
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+# Indented for readable run files; numpy scalars and non-str keys are accepted
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Coarsest directory mtime granularity we allow for (FAT rounds to 2 seconds)
+_MTIME_GRANULARITY_NS = 2_000_000_000
 
 
 class StepMetadata:
     """Captures metadata for a single pipeline step."""
 
+    # One instance per executed step; slots drop the per-instance __dict__
+    __slots__ = (
+        "name",
+        "input_rows",
+        "output_rows",
+        "duration",
+        "start_time",
+        "end_time",
+        "parameters",
+        "result_code",
+        "error",
+    )
+
     def __init__(
         self,
         name: str,
@@ -94,8 +116,9 @@ class PipelineMetadata:
         self.steps: List[StepMetadata] = []
         self.quality_index = quality_index
         self.context_files = context_files
-        self.input_rows: Optional[int] = None
-        self.output_rows: Optional[int] = None
+        # Explicit overrides; when unset, row counts are derived from steps on access
+        self._input_rows: Optional[int] = None
+        self._output_rows: Optional[int] = None
         # Track overall pipeline result code (0 == success, negative == error)
         self.result_code: Optional[int] = 0
         self.error = error
@@ -105,13 +128,39 @@ class PipelineMetadata:
         """Calculate total duration in seconds."""
         return (self.end_time - self.start_time).total_seconds()
 
+    @property
+    def input_rows(self) -> Optional[int]:
+        """Rows entering the pipeline (first step's input unless set explicitly)."""
+        if self._input_rows is not None:
+            return self._input_rows
+        return self.steps[0].input_rows if self.steps else None
+
+    @input_rows.setter
+    def input_rows(self, value: Optional[int]) -> None:
+        self._input_rows = value
+
+    @property
+    def output_rows(self) -> Optional[int]:
+        """Rows leaving the pipeline (last step's output unless set explicitly)."""
+        if self._output_rows is not None:
+            return self._output_rows
+        return self.steps[-1].output_rows if self.steps else None
+
+    @output_rows.setter
+    def output_rows(self, value: Optional[int]) -> None:
+        self._output_rows = value
+
     def add_step(self, step: StepMetadata) -> None:
-        """Add a step's metadata to the pipeline."""
+        """Add a step's metadata to the pipeline.
+
+        Row totals are not recomputed here; they are derived from steps when read.
+        As before, a new step takes over output_rows (and the first step input_rows)
+        from any value set explicitly earlier.
+        """
         self.steps.append(step)
-        # Update total input/output rows
-        if not self.steps or len(self.steps) == 1:
-            self.input_rows = step.input_rows
-        self.output_rows = step.output_rows
+        self._output_rows = None
+        if len(self.steps) == 1:
+            self._input_rows = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert pipeline metadata to dictionary for serialization."""
@@ -204,6 +253,8 @@ class MetadataRepository:
         logging.info(f"[MetadataRepository] Using storage path: {storage_path}")
 
         self.storage_path = Path(storage_path)
+        # (directory st_mtime_ns, sorted run_ids) from the last list_runs scan
+        self._runs_cache: Optional[Tuple[int, List[str]]] = None
 
     def save(self, pipeline_metadata: PipelineMetadata) -> str:
         """Save pipeline metadata to storage.
@@ -217,11 +268,25 @@ class MetadataRepository:
         # Create storage directory if it doesn't exist
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+        # Our own saves can land within the directory's mtime granularity, so never trust the cache after one
+        self._runs_cache = None
+
         # Save to file using run_id as filename
         file_path = self.storage_path / f"{pipeline_metadata.run_id}.json"
 
-        with open(file_path, "w") as f:
-            json.dump(pipeline_metadata.to_dict(), f, indent=2)
+        # Serialize to bytes up front so the file receives a single write
+        payload = orjson.dumps(pipeline_metadata.to_dict(), option=_ORJSON_OPTIONS)
+
+        # Write beside the target and rename over it, so readers never see a partial run file.
+        # The dot-prefixed .tmp name is invisible to list_runs' *.json glob.
+        tmp_path = self.storage_path / f".{pipeline_metadata.run_id}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         return pipeline_metadata.run_id
 
@@ -239,8 +304,7 @@ class MetadataRepository:
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = orjson.loads(file_path.read_bytes())
 
         # Reconstruct PipelineMetadata from dict
         pipeline = PipelineMetadata(
@@ -286,12 +350,26 @@ class MetadataRepository:
         Returns:
             List of run_ids in storage
         """
-        if not self.storage_path.exists():
+        try:
+            mtime_ns = self.storage_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        runs = []
-        for file_path in self.storage_path.glob("*.json"):
-            run_id = file_path.stem
-            runs.append(run_id)
-
-        return sorted(runs)
+        # Adding, removing or renaming a run file bumps the directory mtime
+        if self._runs_cache is None or self._runs_cache[0] != mtime_ns:
+            # DirEntry carries the file type from readdir, so only symlinks need a stat
+            with os.scandir(self.storage_path) as entries:
+                runs = sorted(
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                )
+            # A file written by another process in the same mtime tick as this scan would not
+            # change the mtime, so (like git's racy index check) only trust settled directories
+            if time.time_ns() - mtime_ns >= _MTIME_GRANULARITY_NS:
+                self._runs_cache = (mtime_ns, runs)
+            else:
+                self._runs_cache = None
+            return runs
+
+        return list(self._runs_cache[1])
@@ -1,12 +1,13 @@
-import json
+import fnmatch
 import logging
 import os
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, Hashable, List, Optional, Tuple
 
+import orjson
 import pandas as pd
 import requests
 
@@ -16,6 +17,8 @@ from .categorization_types import (CategorizationContext,
                                    CategorizationSuccess, Category,
                                    Transaction)
 from .command_result import CommandResult
+from .metadata import MetadataCollector, StepMetadata
+from .step_cache import StepCache
 
 # Decorator-based command registry
 COMMAND_REGISTRY = {}
@@ -26,13 +29,34 @@ def register_command(cls):
     return cls
 
 
+def _step_name(command: Any) -> str:
+    """Name recorded for a step; commands need not subclass PipelineCommand."""
+    return getattr(command, "step_name", type(command).__name__)
+
+
 class PipelineCommand(ABC):
+    # Name recorded in StepMetadata and logs; defaults to the class name per subclass
+    step_name: ClassVar[str] = "PipelineCommand"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "step_name" not in cls.__dict__:
+            cls.step_name = cls.__name__
+
     @abstractmethod
     def process(
         self, df: Optional[pd.DataFrame], context: Optional[Dict[str, Any]] = None
     ) -> CommandResult:
         pass
 
+    def fingerprint(self) -> Optional[Hashable]:
+        """Hashable identity of this command's configuration for step caching.
+
+        Return None (the default) when the result depends on anything other than
+        the input DataFrame, e.g. files, remote services or side effects.
+        """
+        return None
+
 
 @register_command
 class MergeTrainnedDataCommand(PipelineCommand):
@@ -130,10 +154,12 @@ class MergeTrainnedDataCommand(PipelineCommand):
 
 @register_command
 class ApplyFunctionsCommand(PipelineCommand):
-    def __init__(self, functions=None, context: Optional[Dict[str, Any]] = None):
+    def __init__(self, functions=None, context: Optional[Dict[str, Any]] = None, cacheable: bool = False):
         # accept context for compatibility with workflows
         self.context = context or {}
         self.functions = functions or [ApplyFunctionsCommand.dummy_function]
+        # Opt-in: step caching is only safe when every function is pure
+        self.cacheable = cacheable
 
     def process(self, df: Optional[pd.DataFrame], context: Optional[Dict[str, Any]] = None) -> CommandResult:
         if df is None or df.empty:
@@ -146,6 +172,12 @@ class ApplyFunctionsCommand(PipelineCommand):
         logging.info(f"[ApplyFunctionsCommand] Cleaned data: {len(df)} rows remain after cleaning. Shape: {df.shape}")
         return CommandResult(return_code=0, data=df)
 
+    def fingerprint(self) -> Optional[Hashable]:
+        if not self.cacheable:
+            return None
+        # Function objects hash by identity; holding them in the key keeps ids from being reused
+        return (self.step_name, tuple(self.functions))
+
     @staticmethod
     def dummy_function(df: pd.DataFrame) -> pd.DataFrame:
         return df
@@ -173,6 +205,9 @@ class AppendFilesCommand(PipelineCommand):
         self.file_filter = file_filter or (lambda f: True)
         self.input_files = input_files
         self.context = context or {}
+        # Plain "*<suffix>" globs are matched with str.endswith instead of fnmatch
+        tail = file_glob[1:] if file_glob.startswith("*") else None
+        self._suffix = tail if tail is not None and not any(c in tail for c in "*?[") else None
         logging.debug(
             f"[AppendFilesCommand] Initialized with input_dir={self.input_dir}, file_glob={self.file_glob}, input_files={self.input_files}"
         )
@@ -193,11 +228,7 @@ class AppendFilesCommand(PipelineCommand):
             logging.debug(
                 f"[AppendFilesCommand] Listing files in directory: {self.input_dir} with glob: {self.file_glob}"
             )
-            files = [
-                f
-                for f in Path(self.input_dir).glob(self.file_glob)
-                if self.file_filter(f)
-            ]
+            files = [f for f in self._list_input_dir() if self.file_filter(f)]
         else:
             return CommandResult(
                 return_code=-1,
@@ -244,6 +275,25 @@ class AppendFilesCommand(PipelineCommand):
             return_code=0, data=combined, metadata_updates=metadata_updates
         )
 
+    def _list_input_dir(self) -> List[Path]:
+        """List regular files in input_dir matching file_glob in a single os.scandir pass.
+
+        Patterns that reach into subdirectories ("2024/*.csv", "**/*.csv") go through Path.glob.
+        """
+        if "/" in self.file_glob or "**" in self.file_glob:
+            return list(Path(self.input_dir).glob(self.file_glob))
+        try:
+            with os.scandir(self.input_dir) as entries:
+                return [Path(entry.path) for entry in entries if entry.is_file() and self._matches(entry.name)]
+        except OSError as e:
+            logging.warning(f"[AppendFilesCommand] Could not list {self.input_dir}: {e}")
+            return []
+
+    def _matches(self, name: str) -> bool:
+        if self._suffix is not None:
+            return name.endswith(self._suffix)
+        return fnmatch.fnmatchcase(name, self.file_glob)
+
 
 @register_command
 class SaveFileCommand(PipelineCommand):
@@ -254,6 +304,10 @@ class SaveFileCommand(PipelineCommand):
         context: Optional[Dict[str, Any]] = None,):
 
         self.output_path = Path(output_path)
+        # Resolved once, so the file written and the path recorded in metadata
+        # stay the same even if the working directory changes before process()
+        self._resolved_output_path = self.output_path.resolve()
+        self._output_file_path = str(self._resolved_output_path)
         self.save_empty = save_empty
         self.context = context or {}
 
@@ -263,19 +317,17 @@ class SaveFileCommand(PipelineCommand):
             if df is None or (df.empty and not self.save_empty):
                 return CommandResult(return_code=0, data=df)
                 
-            self.output_path.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(str(self.output_path), index=False)
+            self._resolved_output_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_csv(self._output_file_path, index=False)
             logging.info(
                 f"[SaveFileCommand] Saved to {self.output_path} ({len(df)}) rows"
             )
 
             # Capture absolute file path in metadata_updates for step parameters
-            absolute_path = str(self.output_path.resolve())
-
             return CommandResult(
                 return_code=0,
                 data=df,
-                metadata_updates={"output_file_path": absolute_path},
+                metadata_updates={"output_file_path": self._output_file_path},
             )
         except Exception as e:
             return CommandResult(return_code=-1, data=None, error={"message": str(e)})
@@ -365,12 +417,11 @@ class AIRemoteCategorizationCommand(PipelineCommand):
 
         try:
             file_path = self.context[context_key]
-            with open(file_path, "r") as f:
-                context_data = json.load(f)
-                logging.debug(
-                    f"[AIRemoteCategorizationCommand] Loaded {context_key} from {file_path}"
-                )
-                return [context_data]
+            context_data = orjson.loads(Path(file_path).read_bytes())
+            logging.debug(
+                f"[AIRemoteCategorizationCommand] Loaded {context_key} from {file_path}"
+            )
+            return [context_data]
         except Exception as e:
             logging.error(f"[AIRemoteCategorizationCommand] Could not load {context_key}: {e}")
             return []
@@ -434,7 +485,7 @@ class AIRemoteCategorizationCommand(PipelineCommand):
 
         response = requests.post(self.service_url, json=payload, params={"impl": self.impl}, timeout=30)
         response.raise_for_status()
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
 
         logging.info(f"[AIRemoteCategorizationCommand] Batch {batch_start+1}-{batch_end} successful")
         return response_data
@@ -503,8 +554,10 @@ class QualityAnalysisCommand(PipelineCommand):
         try:
             # Add consolidated logging for performance debugging
             start_time = time.time()
+            # Calculators only need calculate(); NAME is set for QualityCalculator subclasses
+            calculator_name = getattr(self.calculator, "NAME", type(self.calculator).__name__)
             if df is not None:
-                logging.info(f"[QualityAnalysisCommand] Starting quality analysis: {len(df)} rows, {len(df.columns)} columns, calculator={self.calculator.__class__.__name__}")
+                logging.info(f"[QualityAnalysisCommand] Starting quality analysis: {len(df)} rows, {len(df.columns)} columns, calculator={calculator_name}")
                 
                 metrics = self.calculator.calculate(df)
                 
@@ -517,7 +570,7 @@ class QualityAnalysisCommand(PipelineCommand):
             # Build metadata updates with overall_quality_index
             metadata_updates = {
                 "quality_index": metrics.overall_quality_index,
-                "calculator_name": self.calculator.__class__.__name__,
+                "calculator_name": calculator_name,
                 "quality_metrics": metrics.to_dict(),
             }
 
@@ -530,42 +583,69 @@ class QualityAnalysisCommand(PipelineCommand):
                 metadata_updates=None,
             )
 
+    def fingerprint(self) -> Optional[Hashable]:
+        # Metrics depend only on the input frame and the calculator. Calculators normally hash
+        # by identity; one that is not hashable (e.g. a dataclass with eq) is not cached.
+        try:
+            hash(self.calculator)
+        except TypeError:
+            return None
+        return (self.step_name, self.calculator)
+
 
 class DataPipeline:
-    def __init__(self, commands, collector=None, context=None):
+    def __init__(self, commands, collector=None, context=None, step_cache: Optional[StepCache] = None):
         self.commands = commands
-        if collector is None:
-            from analyzer.pipeline.metadata import MetadataCollector
-
-            collector = MetadataCollector(pipeline_name="DataPipeline")
-        self.collector = collector
+        # Optional, opt-in cache of step results; only commands with a fingerprint are cached.
+        # The bundled workflows and pipeline_runner do not pass one.
+        self.step_cache = step_cache
+        # A collector is always present, so run() never has to branch on it
+        self.collector = collector if collector is not None else MetadataCollector(pipeline_name="DataPipeline")
         self.context = context or {}
 
+    @property
+    def step_names(self) -> Tuple[str, ...]:
+        """Step names in run order, for callers that inspect a pipeline without running it."""
+        return tuple(_step_name(command) for command in self.commands)
+
     def run(self, initial_df=None, repository=None):
         df = initial_df
 
-        # Start pipeline collection
+        # Start pipeline collection; start_pipeline guarantees pipeline_metadata is set
         self.collector.start_pipeline()
+        pipeline_metadata = self.collector.pipeline_metadata
+        # metadata_updates from every step, applied to pipeline metadata once when the run ends
+        pending_updates: Dict[str, Any] = {}
+        # Each step's input is the previous step's output, so rows are counted once per frame
+        input_rows = len(df) if isinstance(df, pd.DataFrame) else 0
+        # One wall-clock read per run; step timestamps are offsets on the monotonic counter
+        run_start_time = datetime.now(timezone.utc)
+        run_start_ns = time.perf_counter_ns()
 
         for command in self.commands:
-            logging.info(f"[DataPipeline] Running step: {command.__class__.__name__}")
-            step_start_time = datetime.now(timezone.utc)
-            start = time.time()
-            input_rows = len(df) if isinstance(df, pd.DataFrame) else 0
-
-            # Run the command and capture result
-            result = command.process(df, context=self.context)
+            step_name = _step_name(command)
+            logging.info(f"[DataPipeline] Running step: {step_name}")
+            start_ns = time.perf_counter_ns()
+            step_start_time = run_start_time + timedelta(microseconds=(start_ns - run_start_ns) // 1000)
+
+            # Run the command and capture result, reusing a cached one for identical input
+            cache_key = self.step_cache.key_for(command, df, self.context) if self.step_cache is not None else None
+            result = self.step_cache.get(cache_key) if cache_key is not None else None
+            if result is None:
+                result = command.process(df, context=self.context)
+                if cache_key is not None:
+                    self.step_cache.put(cache_key, result)
 
             # Compute end timing and rows
-            elapsed = time.time() - start
-            step_end_time = datetime.now(timezone.utc)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            elapsed = elapsed_ns * 1e-9
+            # Round up to whole microseconds so a sub-microsecond step still ends after it starts
+            step_end_time = step_start_time + timedelta(microseconds=-(-elapsed_ns // 1000))
             output_rows = len(result.data) if isinstance(result.data, pd.DataFrame) else 0
 
             # Create step metadata once per step (success or failure)
-            from analyzer.pipeline.metadata import StepMetadata
-
             step_metadata = StepMetadata(
-                name=command.__class__.__name__,
+                name=step_name,
                 input_rows=input_rows,
                 output_rows=output_rows,
                 duration=elapsed,
@@ -577,10 +657,9 @@ class DataPipeline:
             )
             self.collector.track_step(step_metadata)
 
-            # Merge all metadata_updates from command result into pipeline metadata
+            # Collect metadata_updates; later steps override earlier ones for the same key
             if result.metadata_updates:
-                for key, value in result.metadata_updates.items():
-                    setattr(self.collector.pipeline_metadata, key, value)
+                pending_updates.update(result.metadata_updates)
 
             # Merge context updates
             if result.context_updates:
@@ -589,31 +668,32 @@ class DataPipeline:
             # Halt on negative return codes and persist metadata
             if result.return_code < 0:
                 logging.error(
-                    f"[DataPipeline] Command {command.__class__.__name__} failed with return_code={result.return_code}: {result.error}"
+                    f"[DataPipeline] Command {step_name} failed with return_code={result.return_code}: {result.error}"
                 )
-                if self.collector and self.collector.pipeline_metadata:
-                    self.collector.pipeline_metadata.result_code = result.return_code
-                    self.collector.pipeline_metadata.error = result.error
-                    # End collection
-                    self.collector.end_pipeline()
-                    if repository:
-                        repository.save(self.collector.get_pipeline_metadata())
+                self._apply_metadata_updates(pipeline_metadata, pending_updates)
+                pipeline_metadata.result_code = result.return_code
+                pipeline_metadata.error = result.error
+                # End collection
+                self.collector.end_pipeline()
+                if repository:
+                    repository.save(self.collector.get_pipeline_metadata())
                 return pd.DataFrame()
 
             # Continue pipeline flow on success
             df = result.data
+            input_rows = output_rows
+
+        self._apply_metadata_updates(pipeline_metadata, pending_updates)
 
         # End collection
         self.collector.end_pipeline()
 
         # Capture context_files at pipeline end
-        if self.context and self.collector.pipeline_metadata:
-            self.collector.pipeline_metadata.context_files = self.context
+        if self.context:
+            pipeline_metadata.context_files = self.context
         # Set pipeline result_code to last command's return code (assume success if none failed)
-        if self.collector and self.collector.pipeline_metadata:
-            # If not set previously (e.g., in failure), default to 0
-            if self.collector.pipeline_metadata.result_code is None:
-                self.collector.pipeline_metadata.result_code = 0
+        if pipeline_metadata.result_code is None:
+            pipeline_metadata.result_code = 0
 
         # Save metadata if repository provided
         if repository:
@@ -621,3 +701,9 @@ class DataPipeline:
             repository.save(metadata)
 
         return df
+
+    @staticmethod
+    def _apply_metadata_updates(pipeline_metadata, updates: Dict[str, Any]) -> None:
+        # setattr rather than __dict__.update so property setters (e.g. output_rows) still apply
+        for key, value in updates.items():
+            setattr(pipeline_metadata, key, value)
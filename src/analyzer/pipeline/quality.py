@@ -1,16 +1,21 @@
 """Quality metrics calculation and tracking."""
+import numpy as np
 import pandas as pd
 import logging
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QualityMetrics:
-    """Represents quality metrics for a pipeline execution."""
+    """Represents quality metrics for a pipeline execution.
+
+    Instances are immutable results; every score, the overall index included, is
+    computed once by the calculator and only read afterwards.
+    """
 
     completeness: float
     confidence: float
@@ -27,6 +32,23 @@ class QualityMetrics:
         }
 
 
+# Returned for empty input; QualityMetrics is frozen, so one shared instance is safe
+EMPTY_METRICS = QualityMetrics(completeness=0.0, confidence=0.0, consistency=0.0, overall_quality_index=0.0)
+
+
+def _present_mask(values: pd.Series) -> np.ndarray:
+    """Boolean array marking values that are not missing and not blank.
+
+    The blank check only runs on text-like columns, and only on the rows that
+    passed the missing-value check, so each column is masked exactly once.
+    """
+    present = values.notna().to_numpy(copy=True)
+    if pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return present
+    present[present] = values[present].astype(str).str.strip().ne("").to_numpy()
+    return present
+
+
 class QualityDimensionCalculator(ABC):
     """Abstract interface for individual quality dimension calculators."""
     @abstractmethod
@@ -44,41 +66,24 @@ class QualityDimensionCalculator(ABC):
 
 class CompletenessCalculator(QualityDimensionCalculator):
     """Calculates completeness quality dimension based on field presence."""
+    REQUIRED_FIELDS = ("CategoryAnnotation", "SubCategoryAnnotation", "Confidence")
+
     def calculate(self, df: pd.DataFrame) -> float:
         """Calculate completeness score for the dataframe."""
         if df.empty:
             return 0.0
 
-        # Calculate row-level completeness scores
-        row_scores = []
-        for idx, row in df.iterrows():
-            row_score = self._calculate_row_completeness(row)
-            row_scores.append(row_score)
-
-        if not row_scores:
-            return 0.0
-
-        # Apply weighted average calculation
-        completeness_score = self._apply_completeness_weighting(row_scores)
-        return completeness_score
-
-    def _calculate_row_completeness(self, row: pd.Series) -> float:
-        """Calculate completeness score for a single row."""
-        required_fields = ["CategoryAnnotation", "SubCategoryAnnotation", "Confidence"]
-        present_fields = 0
-
-        for field in required_fields:
-            value = row.get(field)
-            if not pd.isna(value) and str(value).strip():
-                present_fields += 1
+        # A row scores the fraction of required fields it has, so the mean row score
+        # is the number of present fields over all rows times fields
+        present_fields = sum(
+            np.count_nonzero(_present_mask(df[field])) for field in self.REQUIRED_FIELDS if field in df.columns
+        )
+        return present_fields / (len(df) * len(self.REQUIRED_FIELDS))
 
-        return present_fields / len(required_fields)
 
-    def _apply_completeness_weighting(self, scores: list) -> float:
-        """Apply weighting to completeness scores."""
-        if not scores:
-            return 0.0
-        return sum(scores) / len(scores)
+# Bucket edges for ConfidenceCalculator weighting; 0.90 itself belongs to the middle bucket
+_CONFIDENCE_BUCKET_EDGES = np.array([0.70, np.nextafter(0.90, np.inf)])
+_CONFIDENCE_BUCKET_WEIGHTS = np.array([3.0, 2.0, 1.0])
 
 
 class ConfidenceCalculator(QualityDimensionCalculator):
@@ -105,41 +110,30 @@ class ConfidenceCalculator(QualityDimensionCalculator):
         if df.empty:
             return 0.0
 
-        valid_scores = []
-        for _, row in df.iterrows():
-            score = self._calculate_row_confidence(row)
-            if score > 0:  # Only include valid (non-zero) scores
-                valid_scores.append(score)
+        scores = self._calculate_row_confidence_scores(df)
+        valid_scores = scores[scores > 0]  # Only include valid (non-zero) scores
 
-        if not valid_scores:
+        if len(valid_scores) == 0:
             return 0.0
 
         # Apply weighted calculation
         return self._apply_confidence_weighting(valid_scores)
 
-    def _calculate_row_confidence(self, row: pd.Series) -> float:
-        """Calculate confidence score for a single row.
+    def _calculate_row_confidence_scores(self, df: pd.DataFrame) -> np.ndarray:
+        """Calculate confidence scores for all rows.
 
         Returns:
-            Confidence value if valid, 0.0 if invalid/missing
+            Confidence values clipped to [0, 1], 0.0 where missing or not numeric
         """
-        confidence = row.get("Confidence")
+        if "Confidence" not in df.columns:
+            return np.zeros(len(df))
 
-        # Check for missing or invalid confidence
-        if pd.isna(confidence):
-            return 0.0
+        confidence = pd.to_numeric(df["Confidence"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
 
-        try:
-            conf_value = float(confidence)
-            # If confidence is 0, row is invalid
-            if conf_value == 0.0:
-                return 0.0
-            # Ensure confidence is in valid range
-            return max(0.0, min(1.0, conf_value))
-        except (ValueError, TypeError):
-            return 0.0
+        # Ensure confidence is in valid range; missing values become invalid rows
+        return np.nan_to_num(np.clip(confidence, 0.0, 1.0), nan=0.0)
 
-    def _apply_confidence_weighting(self, scores: list) -> float:
+    def _apply_confidence_weighting(self, scores: np.ndarray) -> float:
         """Apply weighted calculation where low scores have more impact.
 
         Weighting logic:
@@ -149,24 +143,15 @@ class ConfidenceCalculator(QualityDimensionCalculator):
 
         Returns weighted average where low confidence has more impact.
         """
-        if not scores:
+        if len(scores) == 0:
             return 0.0
 
-        weighted_sum = 0.0
-        total_weight = 0.0
-
-        for score in scores:
-            if score < 0.70:
-                weight = 3.0
-            elif score <= 0.90:
-                weight = 2.0
-            else:
-                weight = 1.0
+        # One bucket index per score: 0 below 0.70, 1 up to and including 0.90, 2 above
+        buckets = np.searchsorted(_CONFIDENCE_BUCKET_EDGES, scores, side="right")
+        weights = _CONFIDENCE_BUCKET_WEIGHTS[buckets]
+        total_weight = np.bincount(buckets, minlength=3) @ _CONFIDENCE_BUCKET_WEIGHTS
 
-            weighted_sum += score * weight
-            total_weight += weight
-
-        return weighted_sum / total_weight if total_weight > 0 else 0.0
+        return float(np.dot(scores, weights) / total_weight) if total_weight > 0 else 0.0
 
 
 class ConsistencyCalculator(QualityDimensionCalculator):
@@ -193,76 +178,65 @@ class ConsistencyCalculator(QualityDimensionCalculator):
             return 0.0
 
         # Group by description prefix and analyze consistency
-        description_groups = self._group_by_description_prefix(df)
+        group_consistency = self._group_consistency_by_description_prefix(df)
 
-        if not description_groups:
+        if group_consistency.empty:
             return 0.0
 
-        consistent_groups = 0
-        total_groups = len(description_groups)
-
-        for group_df in description_groups.values():
-            if self._is_group_consistent(group_df):
-                consistent_groups += 1
+        return np.count_nonzero(group_consistency.to_numpy()) / len(group_consistency)
 
-        return consistent_groups / total_groups if total_groups > 0 else 0.0
+    def _group_consistency_by_description_prefix(self, df: pd.DataFrame, prefix_length: int = 12) -> pd.Series:
+        """Check, per description prefix, whether the group has consistent categorizations.
 
-    def _group_by_description_prefix(self, df: pd.DataFrame, prefix_length: int = 12) -> Dict[str, pd.DataFrame]:
-        """Group transactions by description prefix.
+        Only prefixes shared by more than one transaction form a group. A group is
+        consistent if its categorized rows (category and subcategory both non-blank)
+        carry exactly one unique category+subcategory combination.
 
         Args:
             df: DataFrame with TransactionDescription column
             prefix_length: Length of prefix to group by
 
         Returns:
-            Dict mapping prefix to DataFrame group
+            Boolean Series indexed by prefix
         """
-        groups = {}
-
-        for _, row in df.iterrows():
-            desc = str(row.get("TransactionDescription", "")).strip()
-            if not desc:
-                continue
-
-            prefix = desc[:prefix_length].upper()
-
-            if prefix not in groups:
-                groups[prefix] = []
-            groups[prefix].append(row)
+        if "TransactionDescription" not in df.columns:
+            return pd.Series(dtype=bool)
 
-        # Convert lists to DataFrames
-        return {prefix: pd.DataFrame(rows) for prefix, rows in groups.items() if len(rows) > 1}
+        descriptions = df["TransactionDescription"].astype(str).str.strip()
+        has_description = descriptions.ne("").to_numpy()
 
-    def _is_group_consistent(self, group_df: pd.DataFrame) -> bool:
-        """Check if a group has consistent categorizations.
-
-        Args:
-            group_df: DataFrame group with same description prefix
-
-        Returns:
-            True if all categorizations are identical, False otherwise
-        """
-        if group_df.empty or len(group_df) < 2:
-            return True  # Single transactions are trivially consistent
+        groups = pd.DataFrame({
+            "prefix": descriptions.str[:prefix_length].str.upper(),
+            "category": self._stripped_text(df, "CategoryAnnotation"),
+            "subcategory": self._stripped_text(df, "SubCategoryAnnotation"),
+        })[has_description]
 
-        # Get unique categorizations
-        categories = set()
-        subcategories = set()
+        group_sizes = groups["prefix"].value_counts()
+        multi_row_prefixes = group_sizes.index[group_sizes > 1]
 
-        for _, row in group_df.iterrows():
-            cat = str(row.get("CategoryAnnotation", "")).strip()
-            subcat = str(row.get("SubCategoryAnnotation", "")).strip()
+        categorized = groups[groups["category"].ne("") & groups["subcategory"].ne("")]
+        combinations = categorized.drop_duplicates()["prefix"].value_counts()
 
-            if cat and subcat:
-                categories.add(cat)
-                subcategories.add((cat, subcat))
+        return combinations.reindex(multi_row_prefixes, fill_value=0).eq(1)
 
-        # Group is consistent if there's only one unique category+subcategory combination
-        return len(subcategories) == 1
+    @staticmethod
+    def _stripped_text(df: pd.DataFrame, column: str) -> pd.Series:
+        """Column values as stripped strings, or blanks when the column is absent."""
+        if column not in df.columns:
+            return pd.Series("", index=df.index)
+        return df[column].astype(str).str.strip()
 
 
 class QualityCalculator(ABC):
     """Abstract interface for pluggable quality calculation strategies."""
+    # Reported as calculator_name in pipeline metadata; defaults to the class name per subclass
+    NAME: ClassVar[str] = "QualityCalculator"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "NAME" not in cls.__dict__:
+            cls.NAME = cls.__name__
+
     @abstractmethod
     def calculate(self, df: pd.DataFrame) -> QualityMetrics:
         """Calculate quality metrics for DataFrame.
@@ -317,12 +291,7 @@ class DefaultQualityCalculator(QualityCalculator):
     def calculate(self, df: pd.DataFrame) -> QualityMetrics:
         """Calculate all quality dimensions and overall index."""
         if df.empty:
-            return QualityMetrics(
-                completeness=0.0,
-                confidence=0.0,
-                consistency=0.0,
-                overall_quality_index=0.0,
-            )
+            return EMPTY_METRICS
 
         # Calculate each dimension
         completeness = self.completeness_calculator.calculate(df)
@@ -355,31 +324,12 @@ class SimpleQualityCalculator(QualityCalculator):
         """Calculate simple quality index based only on confidence scores."""
         if df.empty:
             logging.debug("[SimpleQualityCalculator] Empty DataFrame, returning zero metrics")
-            return QualityMetrics(
-                completeness=0.0,
-                confidence=0.0,
-                consistency=0.0,
-                overall_quality_index=0.0,
-            )
-
-        logging.info(f"[SimpleQualityCalculator] Processing {len(df)} rows with iterrows()...")
-        
+            return EMPTY_METRICS
+
+        logging.info(f"[SimpleQualityCalculator] Processing {len(df)} rows...")
+
         # Calculate row-level scores
-        row_scores = []
-        row_count = 0
-        for idx, row in df.iterrows():
-            row_score = self._calculate_row_confidence_score(row)
-            row_scores.append(row_score)
-            row_count += 1
-            
-        if not row_scores:
-            logging.warning("[SimpleQualityCalculator] No valid row scores found")
-            return QualityMetrics(
-                completeness=0.0,
-                confidence=0.0,
-                consistency=0.0,
-                overall_quality_index=0.0,
-            )
+        row_scores = self._calculate_row_confidence_scores(df)
 
         # Apply weighted average calculation
         quality_index = self._apply_confidence_weighting(row_scores)
@@ -393,29 +343,23 @@ class SimpleQualityCalculator(QualityCalculator):
             overall_quality_index=quality_index,
         )
 
-    def _calculate_row_confidence_score(self, row: pd.Series) -> float:
-        """Calculate score for a single row. Returns 0 if any field missing or confidence is 0."""
-        # Check for missing values
-        if (pd.isna(row.get("CategoryAnnotation")) or pd.isna(row.get("SubCategoryAnnotation")) or pd.isna(row.get("Confidence"))):
-            return 0.0
-
-        # Check if category or subcategory are empty strings (whitespace)
-        category = str(row.get("CategoryAnnotation", "")).strip()
-        subcategory = str(row.get("SubCategoryAnnotation", "")).strip()
+    def _calculate_row_confidence_scores(self, df: pd.DataFrame) -> np.ndarray:
+        """Score all rows at once. A row scores 0 if any field is missing or blank or its confidence is 0."""
+        if not {"CategoryAnnotation", "SubCategoryAnnotation", "Confidence"}.issubset(df.columns):
+            return np.zeros(len(df))
 
-        if not category or not subcategory:
-            return 0.0
+        # Each column is masked once; category and subcategory must also be non-blank
+        valid = (_present_mask(df["CategoryAnnotation"]) & _present_mask(df["SubCategoryAnnotation"]) &
+                 df["Confidence"].notna().to_numpy())
 
-        # Get confidence value
-        confidence = float(row.get("Confidence", 0))
-
-        # If confidence is 0, row is invalid
-        if confidence == 0.0:
-            return 0.0
+        # Only rows that passed the checks are converted, matching the old per-row float()
+        scores = np.zeros(len(df))
+        scores[valid] = df["Confidence"].to_numpy()[valid].astype(np.float64)
 
-        return confidence
+        # Confidence of 0 already scores 0, so no separate check is needed
+        return scores
 
-    def _apply_confidence_weighting(self, scores: list) -> float:
+    def _apply_confidence_weighting(self, scores: np.ndarray) -> float:
         """Apply weighted calculation where low scores have more impact.
 
         Currently using simple average. Weighting logic to be clarified:
@@ -423,8 +367,8 @@ class SimpleQualityCalculator(QualityCalculator):
         - Mid scores (0.71-0.90): Medium impact
         - High scores (> 0.90): Lower impact
         """
-        if not scores:
+        if len(scores) == 0:
             return 0.0
 
         # For now, use simple average
-        return sum(scores) / len(scores)
+        return float(np.sum(scores) / len(scores))
@@ -0,0 +1,119 @@
+"""In-memory cache of pipeline step results keyed by command and input content."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+import orjson
+import pandas as pd
+
+from .command_result import CommandResult
+
+StepKey = Tuple[Hashable, bytes, bytes]
+
+
+def fingerprint_dataframe(df: Optional[pd.DataFrame]) -> Optional[bytes]:
+    """Content digest of a DataFrame (values, index, column names and dtypes).
+
+    Object cells are hashed by their string form, so the inferred type of every
+    object column and an object index is mixed in as well; otherwise [1, "a"] and
+    ["1", "a"] would give the same digest.
+    Returns None when the frame cannot be hashed (e.g. cells holding lists), in
+    which case the step is simply not cached.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if df is None:
+        return digest.digest()
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+    except TypeError:
+        return None
+    # The uint64 hash array is contiguous, so it is fed to the digest without a bytes copy
+    digest.update(row_hashes.to_numpy())
+    object_columns = np.flatnonzero((df.dtypes == object).to_numpy())
+    inferred = [
+        pd.api.types.infer_dtype(labels, skipna=False)
+        for labels in [df.index, *(df.iloc[:, position] for position in object_columns)]
+        if labels.dtype == object
+    ]
+    digest.update(repr((list(zip(df.columns, df.dtypes.astype(str))), inferred)).encode())
+    return digest.digest()
+
+
+def fingerprint_context(context) -> Optional[bytes]:
+    """Digest of the pipeline context passed to process(), or None if it cannot be serialized."""
+    if not context:
+        return b""
+    try:
+        payload = orjson.dumps(
+            context, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    except TypeError:
+        return None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class StepCache:
+    """Bounded LRU of successful CommandResults.
+
+    Entries are keyed by (command fingerprint, input DataFrame digest, context
+    digest). Frames are
+    copied on the way in and out so later steps cannot mutate a cached result.
+    A single cache can be shared by several DataPipeline instances. Caching is
+    opt-in: only callers that pass `step_cache=` to DataPipeline use it; the
+    bundled workflows and pipeline_runner run each pipeline once and do not.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[StepKey, CommandResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key_for(self, command, df: Optional[pd.DataFrame], context=None) -> Optional[StepKey]:
+        """Build the cache key for running `command` on `df` with `context`, or None if not cacheable."""
+        # Duck-typed commands without a fingerprint method are simply not cached
+        fingerprint = getattr(command, "fingerprint", None)
+        command_key = fingerprint() if fingerprint is not None else None
+        if command_key is None:
+            return None
+        df_key = fingerprint_dataframe(df)
+        if df_key is None:
+            return None
+        context_key = fingerprint_context(context)
+        if context_key is None:
+            return None
+        return (command_key, df_key, context_key)
+
+    def get(self, key: StepKey) -> Optional[CommandResult]:
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self._entries.move_to_end(key)
+        logging.debug(f"[StepCache] Hit for {key[0]!r}")
+        return self._copy(result)
+
+    def put(self, key: StepKey, result: CommandResult) -> None:
+        """Store a successful result; failures and warnings are never cached."""
+        if result.return_code != 0:
+            return
+        self._entries[key] = self._copy(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _copy(result: CommandResult) -> CommandResult:
+        return CommandResult(
+            return_code=result.return_code,
+            data=result.data.copy() if isinstance(result.data, pd.DataFrame) else result.data,
+            error=result.error,
+            context_updates=dict(result.context_updates) if result.context_updates else result.context_updates,
+            metadata_updates=dict(result.metadata_updates) if result.metadata_updates else result.metadata_updates,
+        )
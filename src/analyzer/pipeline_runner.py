@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from analyzer.pipeline.metadata import MetadataRepository
+from analyzer.pipeline.metadata import MetadataRepository, PipelineMetadata
 from analyzer.pipeline.pipeline_commands import DataPipeline
 # Import workflow definitions
 from analyzer.workflows import (ai_categorization, bank_transaction_analysis,
@@ -51,8 +51,6 @@ def main():
     repository = MetadataRepository(storage_path=metadata_path)
 
     # Create PipelineMetadata instance and inject into DataPipeline's collector
-    from analyzer.pipeline.metadata import PipelineMetadata
-
     pipeline_metadata = PipelineMetadata(
         pipeline_name=args.workflow, start_time=datetime.now(), end_time=datetime.now()
     )
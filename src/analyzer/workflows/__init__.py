@@ -1 +1,19 @@
 # Pipelines package
+import importlib
+from types import ModuleType
+
+# Workflow submodules are imported on first attribute access (PEP 562), so
+# importing the package does not pull in every workflow and its dependencies.
+__all__ = [
+    "ai_categorization",
+    "bank_extract_clean",
+    "bank_transaction_analysis",
+    "derive_statement_features",
+    "minimal_load",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,129 +1,310 @@
+import numpy as np
 import pandas as pd
 
+# Bank extracts carry dates as dd/mm/yyyy
+_DATE_FORMAT = "%d/%m/%Y"
+# ISO dates are the one other layout that must not be read day-first
+_ISO_DATE = r"\d{4}-\d{2}-\d{2}"
+# Byte offsets of the day, month and year digits in a dd/mm/yyyy value
+_DIGIT_POSITIONS = [0, 1, 3, 4, 6, 7, 8, 9]
+# Whole days representable as datetime64[ns]
+_MIN_DAY = np.datetime64(pd.Timestamp.min.ceil("D").date(), "D")
+_MAX_DAY = np.datetime64(pd.Timestamp.max.floor("D").date(), "D")
 
-def derive_statement_features(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty:
-        # Handle empty dataframe case
-        df = df.copy()
-        df["TransactionDate"] = pd.to_datetime(
-            df.get("TransactionDate", pd.Series([], dtype="datetime64[ns]"))
-        )
-        df["Year"] = pd.Series([], dtype="Int64")
-        df["Month"] = pd.Series([], dtype="Int64")
-        df["Day"] = pd.Series([], dtype="Int64")
-        df["DayOfWeek"] = pd.Series([], dtype="Int64")
-        df["WeekOfYear"] = pd.Series([], dtype="UInt32")
-        df["WeekOfMonth"] = pd.Series([], dtype="Int64")
-        df["Quarter"] = pd.Series([], dtype="Int64")
-        df["Semester"] = pd.Series([], dtype="Int64")
-        df["IsWeekend"] = pd.Series([], dtype="boolean")
-        df["RunningSum"] = pd.Series([], dtype="float64")
-        df["RunningCount"] = pd.Series([], dtype="Int64")
-        df["RunningAverage"] = pd.Series([], dtype="float64")
-        df["RunningSumYear"] = pd.Series([], dtype="float64")
-        df["RunningCountYear"] = pd.Series([], dtype="Int64")
-        df["RunningAverageYear"] = pd.Series([], dtype="float64")
-        df["RunningSumMonth"] = pd.Series([], dtype="float64")
-        df["RunningCountMonth"] = pd.Series([], dtype="Int64")
-        df["RunningAverageMonth"] = pd.Series([], dtype="float64")
-        df["TransactionValueBin"] = pd.Categorical(
-            [],
-            categories=[
-                "0-10",
-                "10.01-50",
-                "50.01-150",
-                "150.01-500",
-                "500.01-1500",
-                "1500+",
-            ],
-        )
-        return df
-
-    df["TransactionDate"] = pd.to_datetime(
-        df["TransactionDate"], dayfirst=True, errors="coerce"
-    )
-    df["Year"] = df["TransactionDate"].dt.year
-    df["Month"] = df["TransactionDate"].dt.month
-    df["Day"] = df["TransactionDate"].dt.day
-    df["DayOfWeek"] = df["TransactionDate"].dt.dayofweek
-    df["WeekOfYear"] = df["TransactionDate"].dt.isocalendar().week
-    df["WeekOfMonth"] = ((df["TransactionDate"].dt.day - 1) // 7) + 1
-    df["Quarter"] = df["TransactionDate"].dt.quarter
-    df["Semester"] = ((df["TransactionDate"].dt.month - 1) // 6) + 1
-    df["IsWeekend"] = df["TransactionDate"].dt.dayofweek >= 5
-
-    # Running calculations (overall chronological by TransactionNumber)
-    # TransactionNumber 1 is earliest, higher numbers are later
-    df_temp = df.copy().reset_index(drop=True)
-    df_temp['original_index'] = df_temp.index
-    df_ascending = df_temp.sort_values("TransactionNumber", ascending=True)  # Sort by TransactionNumber, not date
-    df_ascending["RunningSum"] = df_ascending["TransactionValue"].cumsum()
-    df_ascending["RunningCount"] = range(1, len(df_ascending) + 1)
-    df_ascending["RunningAverage"] = (
-        df_ascending["RunningSum"] / df_ascending["RunningCount"]
-    )
+# TransactionValue bin edges and their labels, built once at import
+_VALUE_BINS = np.array([0, 10, 50, 150, 500, 1500, 999999], dtype=np.float64)
+_VALUE_BIN_DTYPE = pd.CategoricalDtype(
+    ["0-10", "10.01-50", "50.01-150", "150.01-500", "500.01-1500", "1500+"], ordered=True
+)
 
-    # Create a mapping from original index to running values
-    running_map = df_ascending.set_index('original_index')[['RunningSum', 'RunningCount', 'RunningAverage']]
-    
-    # Assign running calculations back to original DataFrame in original order
-    df["RunningSum"] = df.index.map(running_map['RunningSum'])
-    df["RunningCount"] = df.index.map(running_map['RunningCount'])
-    df["RunningAverage"] = df.index.map(running_map['RunningAverage'])
-
-    # Running calculations per year (chronological by TransactionNumber within each year)
-    df_year_temp = df.copy().reset_index(drop=True)
-    df_year_temp['original_index'] = df_year_temp.index
-    df_year_ascending = df_year_temp.sort_values(
-        ["Year", "TransactionNumber"], ascending=[True, True]  # Sort by TransactionNumber within year
-    )
-    df_year_ascending["RunningSumYear"] = df_year_ascending.groupby("Year")[
-        "TransactionValue"
-    ].cumsum()
-    df_year_ascending["RunningCountYear"] = (
-        df_year_ascending.groupby("Year").cumcount() + 1
-    )
-    df_year_ascending["RunningAverageYear"] = (
-        df_year_ascending["RunningSumYear"] / df_year_ascending["RunningCountYear"]
-    )
+# Zero-row frame with every derived column and its dtype, returned for empty input
+_EMPTY_FEATURES = pd.DataFrame(
+    {
+        "Year": pd.Series([], dtype="int16"),
+        "Month": pd.Series([], dtype="int8"),
+        "Day": pd.Series([], dtype="int8"),
+        "DayOfWeek": pd.Series([], dtype="int8"),
+        "WeekOfYear": pd.Series([], dtype="int8"),
+        "WeekOfMonth": pd.Series([], dtype="int8"),
+        "Quarter": pd.Series([], dtype="int8"),
+        "Semester": pd.Series([], dtype="int8"),
+        "IsWeekend": pd.Series([], dtype="bool"),
+        "RunningSum": pd.Series([], dtype="float64"),
+        "RunningCount": pd.Series([], dtype="uint32"),
+        "RunningAverage": pd.Series([], dtype="float64"),
+        "RunningSumYear": pd.Series([], dtype="float64"),
+        "RunningCountYear": pd.Series([], dtype="uint32"),
+        "RunningAverageYear": pd.Series([], dtype="float64"),
+        "RunningSumMonth": pd.Series([], dtype="float64"),
+        "RunningCountMonth": pd.Series([], dtype="uint32"),
+        "RunningAverageMonth": pd.Series([], dtype="float64"),
+        "TransactionValueBin": pd.Series([], dtype=_VALUE_BIN_DTYPE),
+    }
+)
 
-    # Create mapping from original index to yearly running values
-    yearly_running_map = df_year_ascending.set_index('original_index')[['RunningSumYear', 'RunningCountYear', 'RunningAverageYear']]
-    
-    # Assign yearly running calculations back to original DataFrame
-    df["RunningSumYear"] = df.index.map(yearly_running_map['RunningSumYear'])
-    df["RunningCountYear"] = df.index.map(yearly_running_map['RunningCountYear'])
-    df["RunningAverageYear"] = df.index.map(yearly_running_map['RunningAverageYear'])
-
-    # Running calculations per month (chronological by TransactionNumber within each month)
-    df_month_temp = df.copy().reset_index(drop=True)
-    df_month_temp['original_index'] = df_month_temp.index
-    df_month_ascending = df_month_temp.sort_values(
-        ["Year", "Month", "TransactionNumber"], ascending=[True, True, True]  # Sort by TransactionNumber within month
-    )
-    df_month_ascending["RunningSumMonth"] = df_month_ascending.groupby(
-        ["Year", "Month"]
-    )["TransactionValue"].cumsum()
-    df_month_ascending["RunningCountMonth"] = (
-        df_month_ascending.groupby(["Year", "Month"]).cumcount() + 1
+
+def _parse_ddmmyyyy_iso(raw: pd.Series) -> tuple[np.ndarray, np.ndarray] | None:
+    """Fast path: reorder dd/mm/yyyy bytes into ISO yyyy-mm-dd and let numpy parse them.
+
+    Returns datetime64[ns] values and a mask of the rows it parsed, or None when no row has
+    the layout or numpy rejects one of them. Rows outside the mask (other layouts, non-digit
+    fields, dates outside the datetime64[ns] range) hold NaT and are left to the caller.
+    """
+    try:
+        # One spare byte per value to detect strings longer than 10 characters
+        encoded = raw.to_numpy().astype("S11")
+    except (UnicodeEncodeError, TypeError, ValueError):
+        return None
+    chars = encoded.view("S1").reshape(-1, 11)
+    digits = chars[:, _DIGIT_POSITIONS]
+    matched = (
+        (chars[:, 2] == b"/")
+        & (chars[:, 5] == b"/")
+        & (chars[:, 10] == b"")
+        & ((digits >= b"0") & (digits <= b"9")).all(axis=1)
     )
-    df_month_ascending["RunningAverageMonth"] = (
-        df_month_ascending["RunningSumMonth"] / df_month_ascending["RunningCountMonth"]
+    if not matched.any():
+        return None
+    iso = np.empty((len(encoded), 10), dtype="S1")
+    iso[:, 0:4] = chars[:, 6:10]
+    iso[:, 4] = b"-"
+    iso[:, 5:7] = chars[:, 3:5]
+    iso[:, 7] = b"-"
+    iso[:, 8:10] = chars[:, 0:2]
+    try:
+        days = iso.view("S10").ravel()[matched].astype("datetime64[D]")
+    except ValueError:
+        return None
+    # Casting to nanoseconds wraps silently outside the datetime64[ns] range
+    in_bounds = (days >= _MIN_DAY) & (days <= _MAX_DAY)
+    parsed = matched.copy()
+    parsed[matched] = in_bounds
+    dates = np.full(len(encoded), np.datetime64("NaT"), dtype="datetime64[ns]")
+    dates[parsed] = days[in_bounds].astype("datetime64[ns]")
+    return dates, parsed
+
+
+def _parse_transaction_dates(raw: pd.Series) -> pd.Series:
+    """Parse TransactionDate with the fixed dd/mm/yyyy format, caching repeated strings.
+
+    Surrounding whitespace is ignored. Values in any other layout fall back to per-value
+    parsing: ISO yyyy-mm-dd as such, everything else day-first as before the fixed format
+    was introduced; unparseable values become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(raw):
+        return raw
+    if pd.api.types.infer_dtype(raw, skipna=True) == "string":
+        raw = raw.str.strip()
+    parsed = _parse_ddmmyyyy_iso(raw)
+    if parsed is None:
+        dates = pd.to_datetime(raw, format=_DATE_FORMAT, exact=True, errors="coerce", cache=True)
+    else:
+        values, matched = parsed
+        dates = pd.Series(values, index=raw.index, name=raw.name)
+        if not matched.all():
+            rest = pd.to_datetime(raw[~matched], format=_DATE_FORMAT, exact=True, errors="coerce", cache=True)
+            dates.iloc[~matched] = rest.to_numpy()
+    unparsed = (dates.isna() & raw.notna()).to_numpy()
+    if unparsed.any():
+        dates.iloc[unparsed] = _parse_other_layouts(raw[unparsed]).to_numpy()
+    return dates
+
+
+def _parse_other_layouts(raw: pd.Series) -> pd.Series:
+    """Parse values that are not dd/mm/yyyy: ISO dates as yyyy-mm-dd, the rest day-first."""
+    dates = pd.Series(np.datetime64("NaT", "ns"), index=raw.index)
+    iso = raw.astype(str).str.fullmatch(_ISO_DATE).to_numpy()
+    if iso.any():
+        dates.iloc[iso] = pd.to_datetime(raw[iso], format="%Y-%m-%d", errors="coerce").to_numpy()
+    if not iso.all():
+        # format="mixed" parses each value on its own, so one layout is not forced on the rest
+        other = pd.to_datetime(raw[~iso], dayfirst=True, format="mixed", errors="coerce")
+        if isinstance(other.dtype, pd.DatetimeTZDtype):
+            other = other.dt.tz_convert(None)
+        dates.iloc[~iso] = other.to_numpy()
+    return dates
+
+
+def _calendar_fields(dates: pd.Series) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Calendar fields from one datetime64[D] buffer using epoch-day arithmetic.
+
+    Returns int16 Year and int8 Month/Day/DayOfWeek/WeekOfYear/WeekOfMonth/Quarter/Semester
+    arrays plus the NaT mask; NaT rows hold placeholder values.
+    """
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)
+    days = dates.to_numpy().astype("datetime64[D]")
+    nat = np.isnat(days)
+    if nat.any():
+        days = np.where(nat, np.datetime64(0, "D"), days)
+    months = days.astype("datetime64[M]")
+    months_since_epoch = months.view(np.int64)
+    month = (months_since_epoch % 12 + 1).astype(np.int8)
+    day = ((days - months).view(np.int64) + 1).astype(np.int8)
+    # 1970-01-01 was a Thursday; Monday is 0 as in Series.dt.dayofweek
+    dayofweek = (days.view(np.int64) + 3) % 7
+    # ISO weeks belong to the year of their Thursday and count from that year's first Thursday week
+    thursday = days - dayofweek + 3
+    iso_year_start = thursday.astype("datetime64[Y]").astype("datetime64[D]")
+    fields = {
+        "Year": (months_since_epoch // 12 + 1970).astype(np.int16),
+        "Month": month,
+        "Day": day,
+        "DayOfWeek": dayofweek.astype(np.int8),
+        "WeekOfYear": ((thursday - iso_year_start).view(np.int64) // 7 + 1).astype(np.int8),
+        "WeekOfMonth": (day - 1) // 7 + 1,
+        "Quarter": (month - 1) // 3 + 1,
+        "Semester": (month - 1) // 6 + 1,
+    }
+    return fields, nat
+
+
+def _downcast(values, dtype: str, nat: np.ndarray):
+    """Cast to a compact integer dtype, using the nullable variant when dates failed to parse."""
+    values = np.asarray(values).astype(dtype, copy=False)
+    if nat.any():
+        return pd.arrays.IntegerArray(values, nat.copy())
+    return values
+
+
+def _chronological_order(transaction_numbers: np.ndarray) -> np.ndarray:
+    """Stable argsort of TransactionNumber.
+
+    Transaction numbers are normally unique, so the much faster unstable sort gives the
+    same permutation; the stable sort only runs when equal numbers are actually present.
+    """
+    order = transaction_numbers.argsort()
+    ordered = transaction_numbers[order]
+    # NaN sorts last and never compares equal, so two NaNs show up as a NaN second-to-last
+    if (ordered[1:] == ordered[:-1]).any() or (len(ordered) > 1 and ordered[-2] != ordered[-2]):
+        return transaction_numbers.argsort(kind="stable")
+    return order
+
+
+def _unsort(values: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Scatter values computed in sorted order back to the original row positions."""
+    result = np.empty(len(values), dtype=values.dtype)
+    result[order] = values
+    return result
+
+
+def _running_stats(
+    filled: np.ndarray, keys: np.ndarray, order: np.ndarray, missing_rows: np.ndarray, invalid_rows: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Running sum, count and average of values within each key, in original row positions.
+
+    filled (values with NaN as 0) and keys are in chronological order and order maps them
+    back to the rows. A stable argsort makes every key contiguous; sums are one cumsum minus
+    the total before each group start, and results are scattered straight to their rows
+    through the composed permutation. Like groupby().cumsum()/cumcount(), rows in
+    missing_rows get a NaN sum but are still counted, and rows in invalid_rows (no valid
+    key) get NaN sums and averages and a missing (nullable UInt32) count.
+    """
+    n = len(filled)
+    perm = np.argsort(keys, kind="stable")
+    grouped = filled[perm]
+    sorted_keys = keys[perm]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, n]))
+    cum = np.cumsum(grouped)
+    rows = order[perm]
+    sums = np.empty(n)
+    sums[rows] = cum - np.r_[0.0, cum][group_start]
+    counts = np.empty(n, dtype=np.uint32)
+    counts[rows] = np.arange(n) - group_start + 1
+    sums[missing_rows] = np.nan
+    if len(invalid_rows):
+        sums[invalid_rows] = np.nan
+        averages = sums / counts
+        invalid = np.zeros(n, dtype=bool)
+        invalid[invalid_rows] = True
+        return sums, pd.arrays.IntegerArray(counts, invalid), averages
+    return sums, counts, sums / counts
+
+
+def _bin_values(values: np.ndarray) -> pd.Categorical:
+    """Bin values into right-closed _VALUE_BINS intervals (the first one also closed on the left).
+
+    Equivalent to pd.cut(..., include_lowest=True); values outside the edges and NaN map to NaN.
+    """
+    codes = np.searchsorted(_VALUE_BINS, values, side="left") - 1
+    codes[values == _VALUE_BINS[0]] = 0
+    codes[codes >= len(_VALUE_BIN_DTYPE.categories)] = -1
+    return pd.Categorical.from_codes(codes, dtype=_VALUE_BIN_DTYPE)
+
+
+def derive_statement_features(df: pd.DataFrame) -> pd.DataFrame:
+    if len(df.index) == 0:
+        # Nothing to derive: attach the prebuilt zero-row feature columns
+        dates = pd.to_datetime(df.get("TransactionDate", pd.Series([], dtype="datetime64[ns]")))
+        base = df.drop(columns=list(_EMPTY_FEATURES.columns), errors="ignore").assign(TransactionDate=dates)
+        return pd.concat([base, _EMPTY_FEATURES.set_axis(base.index)], axis=1)
+
+    # Statements repeat the same dates many times: parse and decompose each distinct value
+    # once, then gather the results back to every row. Missing dates have code -1, which
+    # picks the NaT appended after the unique values when there are any.
+    # New columns are collected here and attached with a single concat at the end.
+    codes, uniques = pd.factorize(df["TransactionDate"])
+    unique_dates = _parse_transaction_dates(pd.Series(uniques))
+    if (codes < 0).any():
+        unique_dates = pd.concat([unique_dates, pd.Series([pd.NaT], dtype=unique_dates.dtype)], ignore_index=True)
+    unique_fields, unique_nat = _calendar_fields(unique_dates)
+    dates = pd.Series(unique_dates.array.take(codes), index=df.index)
+    fields = {name: values[codes] for name, values in unique_fields.items()}
+    nat = unique_nat[codes]
+    features = {
+        "Year": _downcast(fields["Year"], "int16", nat),
+        "Month": _downcast(fields["Month"], "int8", nat),
+        "Day": _downcast(fields["Day"], "int8", nat),
+        "DayOfWeek": _downcast(fields["DayOfWeek"], "int8", nat),
+        "WeekOfYear": _downcast(fields["WeekOfYear"], "int8", nat),
+        "WeekOfMonth": _downcast(fields["WeekOfMonth"], "int8", nat),
+        "Quarter": _downcast(fields["Quarter"], "int8", nat),
+        "Semester": _downcast(fields["Semester"], "int8", nat),
+        "IsWeekend": (fields["DayOfWeek"] >= 5) & ~nat,
+    }
+
+    # Running calculations, chronological by TransactionNumber (1 is earliest, higher is later).
+    # Sort once and prepare the values, NaN rows and undated rows a single time; both the
+    # Year and the Year+Month level then scan the same arrays and scatter their sum/count/
+    # average back to the original row positions.
+    order = _chronological_order(df["TransactionNumber"].to_numpy())
+    values = df["TransactionValue"].to_numpy(dtype=np.float64)[order]
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+    missing_rows = order[missing]
+    valid = ~nat[order]
+    invalid_rows = order[~valid]
+    year = fields["Year"][order]
+    year_key = np.where(valid, year, -1).astype(np.int16)
+    # Months counted from the earliest year keep the combined key within int16
+    first_year = year[valid].min() if valid.any() else 0
+    month_key = np.where(valid, (year - first_year) * 12 + fields["Month"][order] - 1, -1).astype(np.int16)
+
+    running_sum = np.empty(len(values))
+    running_sum[order] = np.cumsum(filled)
+    running_sum[missing_rows] = np.nan
+    running_count = _unsort(np.arange(1, len(values) + 1, dtype=np.uint32), order)
+    sum_year, count_year, average_year = _running_stats(filled, year_key, order, missing_rows, invalid_rows)
+    sum_month, count_month, average_month = _running_stats(filled, month_key, order, missing_rows, invalid_rows)
+
+    features.update(
+        RunningSum=running_sum,
+        RunningCount=running_count,
+        RunningAverage=running_sum / running_count,
+        RunningSumYear=sum_year,
+        RunningCountYear=count_year,
+        RunningAverageYear=average_year,
+        RunningSumMonth=sum_month,
+        RunningCountMonth=count_month,
+        RunningAverageMonth=average_month,
     )
 
-    # Create mapping from original index to monthly running values
-    monthly_running_map = df_month_ascending.set_index('original_index')[['RunningSumMonth', 'RunningCountMonth', 'RunningAverageMonth']]
-    
-    # Assign monthly running calculations back to original DataFrame
-    df["RunningSumMonth"] = df.index.map(monthly_running_map['RunningSumMonth'])
-    df["RunningCountMonth"] = df.index.map(monthly_running_map['RunningCountMonth'])
-    df["RunningAverageMonth"] = df.index.map(monthly_running_map['RunningAverageMonth'])
     # Value binning
-    bins = [0, 10, 50, 150, 500, 1500, 999999]
-    labels = ["0-10", "10.01-50", "50.01-150", "150.01-500", "500.01-1500", "1500+"]
-    df["TransactionValueBin"] = pd.cut(
-        df["TransactionValue"], bins=bins, labels=labels, include_lowest=True
-    )
+    features["TransactionValueBin"] = _bin_values(df["TransactionValue"].to_numpy(dtype=np.float64))
 
-    # Return dataframe in original order (assumed to be descending date order)
-    return df
+    # Keep the original row order; re-derived columns replace any stale ones
+    stale = [column for column in df.columns if column in features]
+    base = df.drop(columns=stale) if len(stale) else df
+    base = base.assign(TransactionDate=dates)
+    return pd.concat([base, pd.DataFrame(features, index=df.index)], axis=1)
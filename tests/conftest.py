@@ -13,11 +13,13 @@ Module Structure:
 
 For documentation on specific fixtures, search by name or section heading.
 """
+import io
+import logging
 import pytest
 import pandas as pd
 import tempfile
 import os
-import json
+import orjson
 import sys
 import argparse
 from pathlib import Path
@@ -32,6 +34,39 @@ from analyzer.pipeline.metadata import MetadataCollector, PipelineMetadata, Step
 # from analyzer import pipeline_runner
 
 
+# ============================================================================
+# Session Guards
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def _assert_cwd_unchanged():
+    """Fail any test that leaves the working directory changed.
+
+    Tests that need a different cwd must use monkeypatch.chdir so they stay
+    isolated when the suite runs in parallel (make test-parallel).
+    """
+    cwd = os.getcwd()
+    yield
+    assert os.getcwd() == cwd, f"Test changed cwd to {os.getcwd()} without restoring it"
+
+
+@pytest.fixture
+def disable_logging_without_caplog(request):
+    """Drop log records for tests that do not inspect them.
+
+    Without this every logging call in the code under test still builds a
+    LogRecord for pytest's capture handler. Only the merge and metadata test
+    modules opt in (via pytestmark), so failures elsewhere keep their captured
+    log output; tests that request caplog keep normal logging.
+    """
+    if "caplog" in request.fixturenames:
+        yield
+        return
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
 # ============================================================================
 # Test Command Classes (reusable across all tests)
 # ============================================================================
@@ -46,20 +81,22 @@ class SimpleCommand(PipelineCommand):
 
 class MockLoadCommand(PipelineCommand):
     """Mock command that loads categorized data with good confidence."""
+    # Built once per class; each process() hands out a copy so no test can leak edits into another
+    _DATA = pd.DataFrame({
+        'CategoryAnnotation': ['Food', 'Transport', 'Utilities', 'Entertainment'],
+        'SubCategoryAnnotation': ['Coffee', 'Bus', 'Electric', 'Movie'],
+        'Confidence': [0.95, 0.92, 0.88, 0.75],
+        'Amount': [5.50, 25.00, 120.00, 15.00]
+    })
+
     def process(self, df: pd.DataFrame, context=None) -> CommandResult:
-        data = pd.DataFrame({
-            'CategoryAnnotation': ['Food', 'Transport', 'Utilities', 'Entertainment'],
-            'SubCategoryAnnotation': ['Coffee', 'Bus', 'Electric', 'Movie'],
-            'Confidence': [0.95, 0.92, 0.88, 0.75],
-            'Amount': [5.50, 25.00, 120.00, 15.00]
-        })
-        return CommandResult(return_code=0, data=data)
+        return CommandResult(return_code=0, data=self._DATA.copy())
 
 
 class FakePipeline:
     """Fake pipeline that returns a DataFrame with sample data."""
     def run(self):
-        return pd.DataFrame([{'id': 1}])
+        return pd.DataFrame({'id': [1]})
 
 
 class FakePipelineEmpty:
@@ -72,7 +109,7 @@ class FakeCommand(PipelineCommand):
     """Generic fake command for pipeline testing."""
     def process(self, df: pd.DataFrame, context=None) -> CommandResult:
         if df is None or df.empty:
-            df = pd.DataFrame([{'id': 1}])
+            df = pd.DataFrame({'id': [1]})
         return CommandResult(return_code=0, data=df)
 
 
@@ -174,8 +211,53 @@ def empty_categorized_dataframe():
 # Temporary Directory and File Fixtures
 # ============================================================================
 
+# Golden file contents serialized once at import; fixtures only write the bytes
+_TRANSACTIONS_1_CSV = pd.DataFrame({
+    'TransactionNumber': [1, 2, 3],
+    'TransactionDate': ['01/10/2025', '02/10/2025', '03/10/2025'],
+    'TransactionType': ['DEB', 'FPI', 'DEB'],
+    'TransactionDescription': ['STARBUCKS COFFEE', 'SALARY PAYMENT', 'TESCO SUPERMARKET'],
+    'TransactionValue': [-5.50, 2500.00, -85.30]
+}).to_csv(index=False).encode('utf-8')
+
+_TRANSACTIONS_2_CSV = pd.DataFrame({
+    'TransactionNumber': [4, 5],
+    'TransactionDate': ['04/10/2025', '05/10/2025'],
+    'TransactionType': ['DD', 'DEB'],
+    'TransactionDescription': ['BT GROUP PLC', 'AMAZON PURCHASE'],
+    'TransactionValue': [-45.00, -29.99]
+}).to_csv(index=False).encode('utf-8')
+
+_TRAINING_CSV = pd.DataFrame({
+    'TransactionNumber': [1, 2, 3],
+    'CategoryAnnotation': ['Food & Dining', 'Income', 'Food & Dining'],
+    'SubCategoryAnnotation': ['Coffee Shops', 'Salary', 'Groceries'],
+    'Confidence': [0.9, 0.95, 0.88]
+}).to_csv(index=False).encode('utf-8')
+
+_CATEGORIES_JSON = orjson.dumps({
+    "expense_categories": {
+        "Food & Dining": ["Coffee Shops", "Restaurants", "Groceries"],
+        "Utilities": ["Internet", "Phone"],
+        "Transportation": ["Gas", "Public Transport"]
+    },
+    "income_categories": {
+        "Income": ["Salary", "Freelance"]
+    }
+})
+
+_TYPECODES_JSON = orjson.dumps({
+    "transaction_codes": [
+        {"code": "DD", "description": "Direct Debit"},
+        {"code": "DEB", "description": "Debit Card"},
+        {"code": "FPI", "description": "Faster Payment Incoming"},
+        {"code": "SO", "description": "Standing Order"}
+    ]
+})
+
+
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmp_path):
     """Temporary workspace with standard data directory structure.
     
     Creates:
@@ -187,26 +269,23 @@ def temp_workspace():
     Yields:
         dict with paths to each directory
     
-    Cleanup: Automatic via pytest
+    Cleanup: Built on pytest's tmp_path, which prunes old base directories
+    itself, so no per-test rmtree is paid on teardown.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        
-        paths = {
-            'root': tmpdir,
-            'data': tmpdir_path / 'data',
-            'extratos': tmpdir_path / 'data' / 'extratos' / 'bank_bos',
-            'training': tmpdir_path / 'data' / 'training',
-            'output': tmpdir_path / 'data' / 'output',
-            'context': tmpdir_path / 'context',
-        }
-        
-        # Create all directories
-        for path in paths.values():
-            if isinstance(path, Path):
-                path.mkdir(parents=True, exist_ok=True)
-        
-        yield paths
+    paths = {
+        'root': str(tmp_path),
+        'data': tmp_path / 'data',
+        'extratos': tmp_path / 'data' / 'extratos' / 'bank_bos',
+        'training': tmp_path / 'data' / 'training',
+        'output': tmp_path / 'data' / 'output',
+        'context': tmp_path / 'context',
+    }
+    
+    # Create leaf directories only; parents (e.g. data/) come along via parents=True
+    for key in ('extratos', 'training', 'output', 'context'):
+        paths[key].mkdir(parents=True)
+    
+    yield paths
 
 
 @pytest.fixture
@@ -226,38 +305,31 @@ def test_csv_files(temp_workspace):
         'training': temp_workspace['training'] / 'factoids.csv',
     }
     
-    # Write file 1
-    df1 = pd.DataFrame({
-        'TransactionNumber': [1, 2, 3],
-        'TransactionDate': ['01/10/2025', '02/10/2025', '03/10/2025'],
-        'TransactionType': ['DEB', 'FPI', 'DEB'],
-        'TransactionDescription': ['STARBUCKS COFFEE', 'SALARY PAYMENT', 'TESCO SUPERMARKET'],
-        'TransactionValue': [-5.50, 2500.00, -85.30]
-    })
-    df1.to_csv(paths['file1'], index=False)
-    
-    # Write file 2
-    df2 = pd.DataFrame({
-        'TransactionNumber': [4, 5],
-        'TransactionDate': ['04/10/2025', '05/10/2025'],
-        'TransactionType': ['DD', 'DEB'],
-        'TransactionDescription': ['BT GROUP PLC', 'AMAZON PURCHASE'],
-        'TransactionValue': [-45.00, -29.99]
-    })
-    df2.to_csv(paths['file2'], index=False)
-    
-    # Write training file
-    df_training = pd.DataFrame({
-        'TransactionNumber': [1, 2, 3],
-        'CategoryAnnotation': ['Food & Dining', 'Income', 'Food & Dining'],
-        'SubCategoryAnnotation': ['Coffee Shops', 'Salary', 'Groceries'],
-        'Confidence': [0.9, 0.95, 0.88]
-    })
-    df_training.to_csv(paths['training'], index=False)
+    paths['file1'].write_bytes(_TRANSACTIONS_1_CSV)
+    paths['file2'].write_bytes(_TRANSACTIONS_2_CSV)
+    paths['training'].write_bytes(_TRAINING_CSV)
     
     yield paths
 
 
+@pytest.fixture(scope="session")
+def test_csv_dataframes():
+    """Parsed copies of the test CSV files, read once per session.
+
+    test_csv_files stays function-scoped because it writes into each test's own
+    workspace. Tests that only need the parsed content use this fixture instead
+    and must .copy() a frame before mutating it.
+
+    Returns:
+        dict with 'file1', 'file2' and 'training' DataFrames
+    """
+    return {
+        'file1': pd.read_csv(io.BytesIO(_TRANSACTIONS_1_CSV)),
+        'file2': pd.read_csv(io.BytesIO(_TRANSACTIONS_2_CSV)),
+        'training': pd.read_csv(io.BytesIO(_TRAINING_CSV)),
+    }
+
+
 @pytest.fixture
 def test_context_files(temp_workspace):
     """Create test context JSON files.
@@ -274,31 +346,8 @@ def test_context_files(temp_workspace):
         'typecodes': temp_workspace['context'] / 'transaction_type_codes.json',
     }
     
-    categories = {
-        "expense_categories": {
-            "Food & Dining": ["Coffee Shops", "Restaurants", "Groceries"],
-            "Utilities": ["Internet", "Phone"],
-            "Transportation": ["Gas", "Public Transport"]
-        },
-        "income_categories": {
-            "Income": ["Salary", "Freelance"]
-        }
-    }
-    
-    typecodes = {
-        "transaction_codes": [
-            {"code": "DD", "description": "Direct Debit"},
-            {"code": "DEB", "description": "Debit Card"},
-            {"code": "FPI", "description": "Faster Payment Incoming"},
-            {"code": "SO", "description": "Standing Order"}
-        ]
-    }
-    
-    with open(paths['categories'], 'w') as f:
-        json.dump(categories, f)
-    
-    with open(paths['typecodes'], 'w') as f:
-        json.dump(typecodes, f)
+    paths['categories'].write_bytes(_CATEGORIES_JSON)
+    paths['typecodes'].write_bytes(_TYPECODES_JSON)
     
     yield paths
 
@@ -22,4 +22,13 @@ def test_ai_categorization_pipeline_commands():
     assert isinstance(commands[2], MergeTrainnedDataCommand), "The third command should be MergeTrainnedDataCommand."
     assert isinstance(commands[3], AIRemoteCategorizationCommand), "The fourth command should be AIRemoteCategorizationCommand."
     assert isinstance(commands[4], QualityAnalysisCommand), "The fifth command should be QualityAnalysisCommand."
-    assert isinstance(commands[5], SaveFileCommand), "The sixth command should be SaveFileCommand."
\ No newline at end of file
+    assert isinstance(commands[5], SaveFileCommand), "The sixth command should be SaveFileCommand."
+
+def test_ai_categorization_pipeline_step_names():
+    """Test that the pipeline exposes its step names in run order."""
+    pipeline = get_pipeline()
+
+    assert pipeline.step_names == (
+        "AppendFilesCommand", "ApplyFunctionsCommand", "MergeTrainnedDataCommand",
+        "AIRemoteCategorizationCommand", "QualityAnalysisCommand", "SaveFileCommand",
+    )
@@ -1,3 +1,4 @@
+import orjson
 import pandas as pd
 from unittest.mock import patch, MagicMock
 
@@ -33,13 +34,13 @@ class TestAIRemoteCategorization:
         # Mock successful API response with categories
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "code": "SUCCESS",
             "items": [
                 {"id": "0", "category": {"category": "Food & Dining", "subcategory": "Coffee Shops", "confidence": 0.95}},
                 {"id": "2", "category": {"category": "Food & Dining", "subcategory": "Groceries", "confidence": 0.92}}
             ]
-        }
+        })
         mock_post.return_value = mock_response
 
         # Input
@@ -83,10 +84,10 @@ class TestAIRemoteCategorization:
         # Mock API response with no items (no categorizations)
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "code": "SUCCESS",
             "items": []
-        }
+        })
         mock_post.return_value = mock_response
 
         # Input
@@ -211,14 +212,14 @@ class TestAIRemoteCategorization:
         # Mock successful API response with all transactions categorized
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "code": "SUCCESS",
             "items": [
                 {"id": "0", "category": {"category": "Food & Dining", "subcategory": "Coffee Shops", "confidence": 0.95}},
                 {"id": "1", "category": {"category": "Income", "subcategory": "Salary", "confidence": 0.99}},
                 {"id": "2", "category": {"category": "Food & Dining", "subcategory": "Groceries", "confidence": 0.92}}
             ]
-        }
+        })
         mock_post.return_value = mock_response
 
         # Input
@@ -255,14 +256,14 @@ class TestAIRemoteCategorization:
         # Mock API response with null categories
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "code": "SUCCESS",
             "items": [
                 {"id": "0", "category": None},
                 {"id": "1", "category": None},
                 {"id": "2", "category": None}
             ]
-        }
+        })
         mock_post.return_value = mock_response
 
         # Input
@@ -298,12 +299,12 @@ class TestAIRemoteCategorization:
         # Mock successful API response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "code": "SUCCESS",
             "items": [
                 {"id": "0", "category": {"category": "Food & Dining", "subcategory": "Coffee Shops", "confidence": 0.95}}
             ]
-        }
+        })
         mock_post.return_value = mock_response
 
         # Input with non-existent context file
@@ -382,12 +383,12 @@ class TestAIRemoteCategorization:
         # Mock successful API response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "code": "SUCCESS",
             "items": [
                 {"id": "0", "category": {"category": "Food & Dining", "subcategory": "Coffee Shops", "confidence": 0.95}}
             ]
-        }
+        })
         mock_post.return_value = mock_response
 
         # Input
@@ -58,4 +58,35 @@ def test_append_files_command_with_realistic_data():
             "2024-11-15", "2024-11-15", "2024-11-14",
             "2023-10-10", "2023-10-09", "2023-10-08"
         ]
-        assert df["TransactionDate"].tolist() == expected_dates, "Dates should be in descending order across all files."
\ No newline at end of file
+        assert df["TransactionDate"].tolist() == expected_dates, "Dates should be in descending order across all files."
+
+
+def test_append_files_command_glob_filters_names_and_skips_directories():
+    """Test that file_glob selects matching files only and ignores directories."""
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        pd.DataFrame({"col": [1]}).to_csv(temp_path / "2024_bos.csv", index=False)
+        pd.DataFrame({"col": [2]}).to_csv(temp_path / "2025_bos.csv", index=False)
+        (temp_path / "notes.txt").write_text("not a csv")
+        (temp_path / "2023_archive.csv").mkdir()
+
+        all_csv = AppendFilesCommand(input_dir=temp_path).process()
+        only_2024 = AppendFilesCommand(input_dir=temp_path, file_glob="2024_*.csv").process()
+
+        assert all_csv.data["col"].tolist() == [2, 1]
+        assert only_2024.data["col"].tolist() == [1]
+
+
+def test_append_files_command_glob_reaches_into_subdirectories():
+    """Test that file_glob patterns with a directory part or ** still find files."""
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        (temp_path / "2024").mkdir()
+        pd.DataFrame({"col": [1]}).to_csv(temp_path / "2024" / "bos.csv", index=False)
+        pd.DataFrame({"col": [2]}).to_csv(temp_path / "top.csv", index=False)
+
+        in_subdir = AppendFilesCommand(input_dir=temp_path, file_glob="2024/*.csv").process()
+        recursive = AppendFilesCommand(input_dir=temp_path, file_glob="**/*.csv").process()
+
+        assert in_subdir.data["col"].tolist() == [1]
+        assert sorted(recursive.data["col"].tolist()) == [1, 2]
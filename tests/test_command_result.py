@@ -3,89 +3,61 @@ import pandas as pd
 import pytest
 from analyzer.pipeline.command_result import CommandResult
 
-
-def test_command_result_with_error():
-    """Test creating a failed CommandResult with error description."""
-    result = CommandResult(
-        return_code=-1,
-        data=None,
-        error={"message": "File not found", "details": "data/missing.csv"}
-    )
-    
-    assert result.return_code == -1
-    assert result.data is None
-    assert result.error == {"message": "File not found", "details": "data/missing.csv"}
-
-
-def test_command_result_with_context_updates():
-    """Test CommandResult with context updates."""
-    df = pd.DataFrame({'col': [1, 2, 3]})
-    context_updates = {'new_key': 'new_value', 'count': 42}
-    
-    result = CommandResult(
-        return_code=0,
-        data=df,
-        context_updates=context_updates
-    )
-    
-    assert result.context_updates == context_updates
-
-
-def test_command_result_with_metadata_updates():
-    """Test CommandResult with metadata updates."""
-    df = pd.DataFrame({'col': [1, 2, 3]})
-    metadata_updates = {'quality_index': 0.85, 'step_quality': {'completeness': 95}}
-    
-    result = CommandResult(
-        return_code=0,
-        data=df,
-        metadata_updates=metadata_updates
-    )
-    
-    assert result.metadata_updates == metadata_updates
-
-
-def test_command_result_complete():
-    """Test CommandResult with all fields populated."""
-    df = pd.DataFrame({'col': [1, 2, 3]})
-    context_updates = {'key': 'value'}
-    metadata_updates = {'quality': 0.9}
-    
-    result = CommandResult(
-        return_code=0,
-        data=df,
-        error=None,
-        context_updates=context_updates,
-        metadata_updates=metadata_updates
-    )
-    
-    assert result.return_code == 0
-    assert result.data is df
-    assert result.error is None
-    assert result.context_updates == context_updates
-    assert result.metadata_updates == metadata_updates
-
-
-def test_command_result_warning_return_code():
-    """Test CommandResult with positive return code (warning)."""
-    df = pd.DataFrame({'col': [1, 2, 3]})
-    result = CommandResult(
-        return_code=1,
-        data=df,
-        error={"message": "Partial failure", "recovered_rows": 9000}
-    )
-    
-    assert result.return_code == 1  # Positive = warning, continue
-    assert result.data is df
-
-
-def test_command_result_halt_return_code():
-    """Test CommandResult with negative return code (halt)."""
-    result = CommandResult(
-        return_code=-1,
-        data=None,
-        error={"message": "Critical error - halting pipeline"}
-    )
-    
-    assert result.return_code == -1  # Negative = halt pipeline
-    assert result.data is None
+# Built once at import; the tests only check that CommandResult keeps the reference
+TINY_DF = pd.DataFrame({'col': [1, 2, 3]})
+
+
+@pytest.mark.parametrize("kwargs,expected", [
+    # Failed result with error description
+    (
+        dict(return_code=-1, data=None, error={"message": "File not found", "details": "data/missing.csv"}),
+        dict(return_code=-1, data=None, error={"message": "File not found", "details": "data/missing.csv"}),
+    ),
+    # Context updates
+    (
+        dict(return_code=0, data=TINY_DF, context_updates={'new_key': 'new_value', 'count': 42}),
+        dict(context_updates={'new_key': 'new_value', 'count': 42}),
+    ),
+    # Metadata updates
+    (
+        dict(return_code=0, data=TINY_DF,
+             metadata_updates={'quality_index': 0.85, 'step_quality': {'completeness': 95}}),
+        dict(metadata_updates={'quality_index': 0.85, 'step_quality': {'completeness': 95}}),
+    ),
+    # All fields populated
+    (
+        dict(return_code=0, data=TINY_DF, error=None,
+             context_updates={'key': 'value'}, metadata_updates={'quality': 0.9}),
+        dict(return_code=0, data=TINY_DF, error=None,
+             context_updates={'key': 'value'}, metadata_updates={'quality': 0.9}),
+    ),
+    # Positive return code = warning, continue
+    (
+        dict(return_code=1, data=TINY_DF, error={"message": "Partial failure", "recovered_rows": 9000}),
+        dict(return_code=1, data=TINY_DF),
+    ),
+    # Negative return code = halt pipeline
+    (
+        dict(return_code=-1, data=None, error={"message": "Critical error - halting pipeline"}),
+        dict(return_code=-1, data=None),
+    ),
+], ids=["error", "context_updates", "metadata_updates", "complete", "warning", "halt"])
+def test_command_result_construction(kwargs, expected):
+    """Test CommandResult keeps every field it was constructed with."""
+    result = CommandResult(**kwargs)
+
+    for field, value in expected.items():
+        actual = getattr(result, field)
+        if value is None or value is TINY_DF:
+            assert actual is value, f"Expected {field} to be {value!r}"
+        else:
+            assert actual == value, f"Expected {field}={value!r}, got {actual!r}"
+
+
+def test_command_result_uses_slots():
+    """Test that CommandResult carries no per-instance __dict__."""
+    result = CommandResult(return_code=0)
+
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.unexpected_field = 1
@@ -3,7 +3,7 @@ import pytest
 import pandas as pd
 from unittest.mock import patch, MagicMock
 
-from analyzer.workflows import bank_transaction_analysis, ai_categorization, minimal_load
+from analyzer import workflows
 from analyzer.pipeline.pipeline_commands import MergeTrainnedDataCommand, ApplyFunctionsCommand, AppendFilesCommand, AIRemoteCategorizationCommand
 from conftest import assert_command_result_success, assert_command_result_failure
 
@@ -11,13 +11,13 @@ from conftest import assert_command_result_success, assert_command_result_failur
 class TestDataPipelineIntegration:
     """Integration tests for complete data pipeline workflows."""
 
-    @pytest.mark.parametrize("workflow_module,mock_response_data,validate_contents,check_output_file", [
-        (bank_transaction_analysis, b'{"code": "SUCCESS", "items": []}', True, 'annotated_bos.csv'),
-        (ai_categorization, b'{"code": "SUCCESS", "items": [{"id": "1", "category": "Food & Dining", "subcategory": "Coffee Shops", "confidence": 0.95}]}', False, None),
-        (minimal_load, None, True, None),
+    @pytest.mark.parametrize("workflow_name,mock_response_data,validate_contents,check_output_file", [
+        ('bank_transaction_analysis', b'{"code": "SUCCESS", "items": []}', True, 'annotated_bos.csv'),
+        ('ai_categorization', b'{"code": "SUCCESS", "items": [{"id": "1", "category": "Food & Dining", "subcategory": "Coffee Shops", "confidence": 0.95}]}', False, None),
+        ('minimal_load', None, True, None),
     ])
     @patch('urllib.request.urlopen')
-    def test_workflow_integration(self, mock_urlopen, workflow_module, mock_response_data, validate_contents, check_output_file, temp_workspace, test_csv_files, test_context_files):
+    def test_workflow_integration(self, mock_urlopen, workflow_name, mock_response_data, validate_contents, check_output_file, temp_workspace, test_csv_files, test_context_files, monkeypatch):
         """Test workflow integration with parametrized variations.
         
         Parametrizes:
@@ -25,6 +25,9 @@ class TestDataPipelineIntegration:
         - ai_categorization: requires API mock, only validates return type
         - minimal_load: no API needed, validates full contents
         """
+        # Workflow modules are resolved lazily so collection does not import them
+        workflow_module = getattr(workflows, workflow_name)
+
         # Setup mock response (only needed for non-minimal_load workflows)
         if mock_response_data is not None:
             mock_response = MagicMock()
@@ -32,71 +35,57 @@ class TestDataPipelineIntegration:
             mock_response.__enter__.return_value = mock_response
             mock_urlopen.return_value = mock_response
 
-        # Change to temp workspace and run workflow
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_workspace['root'])
-            
-            # Get and run the pipeline
-            pipeline = workflow_module.get_pipeline()
-            result_df = pipeline.run()
-
-            # All workflows must return DataFrames (common contract)
-            assert isinstance(result_df, pd.DataFrame), f"{workflow_module.__name__} should return DataFrame"
-
-            # Some workflows validate additional contracts
-            if validate_contents:
-                assert not result_df.empty, f"{workflow_module.__name__} should return non-empty DataFrame"
-                assert len(result_df) == 5, f"{workflow_module.__name__} should have 5 transactions"
-
-                # Check expected columns
-                expected_columns = ['TransactionDate', 'TransactionType', 'TransactionDescription', 'TransactionValue']
-                for col in expected_columns:
-                    assert col in result_df.columns, f"Missing column {col} in {workflow_module.__name__}"
-
-                # Check output file if specified
-                if check_output_file:
-                    assert os.path.exists(temp_workspace['output'] / check_output_file), f"Expected output file {check_output_file} not created"
-        finally:
-            os.chdir(original_cwd)
+        # Run workflow from the temp workspace (restored automatically by monkeypatch)
+        monkeypatch.chdir(temp_workspace['root'])
+        
+        # Get and run the pipeline
+        pipeline = workflow_module.get_pipeline()
+        result_df = pipeline.run()
+
+        # All workflows must return DataFrames (common contract)
+        assert isinstance(result_df, pd.DataFrame), f"{workflow_module.__name__} should return DataFrame"
+
+        # Some workflows validate additional contracts
+        if validate_contents:
+            assert not result_df.empty, f"{workflow_module.__name__} should return non-empty DataFrame"
+            assert len(result_df) == 5, f"{workflow_module.__name__} should have 5 transactions"
+
+            # Check expected columns
+            expected_columns = ['TransactionDate', 'TransactionType', 'TransactionDescription', 'TransactionValue']
+            for col in expected_columns:
+                assert col in result_df.columns, f"Missing column {col} in {workflow_module.__name__}"
+
+            # Check output file if specified
+            if check_output_file:
+                assert os.path.exists(temp_workspace['output'] / check_output_file), f"Expected output file {check_output_file} not created"
 
     @patch('urllib.request.urlopen')
-    def test_workflow_error_handling(self, mock_urlopen, temp_workspace, test_csv_files, test_context_files):
+    def test_workflow_error_handling(self, mock_urlopen, temp_workspace, test_csv_files, test_context_files, monkeypatch):
         """Test that workflows handle errors gracefully."""
         # Mock the external API to raise an exception
         mock_urlopen.side_effect = Exception("API service unavailable")
 
-        # Change to temp workspace
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_workspace['root'])
-            
-            # Files are already created by fixtures in their proper locations
-            # Run pipeline - should handle the error gracefully
-            pipeline = ai_categorization.get_pipeline()
-            result_df = pipeline.run()
-
-            # Should return a DataFrame rather than crashing
-            assert isinstance(result_df, pd.DataFrame)
-        finally:
-            os.chdir(original_cwd)
-
-    def test_workflow_with_missing_context_files(self, temp_workspace, test_csv_files):
+        monkeypatch.chdir(temp_workspace['root'])
+        
+        # Files are already created by fixtures in their proper locations
+        # Run pipeline - should handle the error gracefully
+        pipeline = workflows.ai_categorization.get_pipeline()
+        result_df = pipeline.run()
+
+        # Should return a DataFrame rather than crashing
+        assert isinstance(result_df, pd.DataFrame)
+
+    def test_workflow_with_missing_context_files(self, temp_workspace, test_csv_files, monkeypatch):
         """Test workflows handle missing context files gracefully."""
-        # Change to temp workspace
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_workspace['root'])
-            
-            # Files are already created by fixtures but no context files
-            # Run minimal workflow (should work without context)
-            pipeline = minimal_load.get_pipeline()
-            result_df = pipeline.run()
-
-            assert isinstance(result_df, pd.DataFrame)
-            assert len(result_df) == 5
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(temp_workspace['root'])
+        
+        # Files are already created by fixtures but no context files
+        # Run minimal workflow (should work without context)
+        pipeline = workflows.minimal_load.get_pipeline()
+        result_df = pipeline.run()
+
+        assert isinstance(result_df, pd.DataFrame)
+        assert len(result_df) == 5
 
     def test_append_files_command(self, temp_workspace, test_csv_files):
         """Test AppendFilesCommand loads and concatenates multiple CSV files."""
@@ -138,7 +127,7 @@ class TestDataPipelineIntegration:
         # Assert CommandResult structure
         assert_command_result_success(result)
         
-        assert result.data.equals(df)  # default_clean just returns df
+        assert result.data is df  # default_clean just returns df
 
     def test_append_files_command_input_files_branch(self, temp_workspace, test_csv_files):
         """Test AppendFilesCommand using input_files parameter."""
@@ -170,32 +159,28 @@ class TestDataPipelineIntegration:
         assert result.data is None, "Expected data=None on error"
         assert result.error is not None, f"Expected error dict, got {result.error}"
 
-    def test_pipeline_saves_metadata_with_result_code(self, temp_workspace, test_csv_files, tmp_path):
+    def test_pipeline_saves_metadata_with_result_code(self, temp_workspace, test_csv_files, tmp_path, monkeypatch):
         """When pipeline completes, metadata should be saved and include result codes."""
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_workspace['root'])
-
-            from analyzer.pipeline.metadata import MetadataRepository
-            # Create repository pointing to tmp_path
-            repo = MetadataRepository(storage_path=tmp_path)
-
-            pipeline = minimal_load.get_pipeline()
-            result_df = pipeline.run(repository=repo)
-
-            # Ensure saved metadata file exists
-            metadata = pipeline.collector.get_pipeline_metadata()
-            loaded = repo.load(metadata.run_id)
-            assert loaded is not None
-            # Pipeline-level result_code should be present and be 0 on success
-            assert hasattr(loaded, 'result_code')
-            assert loaded.result_code == 0
-            # Steps should include a result_code attribute per step
-            assert len(loaded.steps) > 0
-            assert hasattr(loaded.steps[0], 'result_code')
-            assert loaded.steps[0].result_code == 0
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(temp_workspace['root'])
+
+        from analyzer.pipeline.metadata import MetadataRepository
+        # Create repository pointing to tmp_path
+        repo = MetadataRepository(storage_path=tmp_path)
+
+        pipeline = workflows.minimal_load.get_pipeline()
+        result_df = pipeline.run(repository=repo)
+
+        # Ensure saved metadata file exists
+        metadata = pipeline.collector.get_pipeline_metadata()
+        loaded = repo.load(metadata.run_id)
+        assert loaded is not None
+        # Pipeline-level result_code should be present and be 0 on success
+        assert hasattr(loaded, 'result_code')
+        assert loaded.result_code == 0
+        # Steps should include a result_code attribute per step
+        assert len(loaded.steps) > 0
+        assert hasattr(loaded.steps[0], 'result_code')
+        assert loaded.steps[0].result_code == 0
 
     def test_append_files_command_read_error(self, temp_workspace):
         """Test AppendFilesCommand when file read fails."""
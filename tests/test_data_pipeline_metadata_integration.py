@@ -60,6 +60,21 @@ def test_data_pipeline_run_collects_metadata():
     assert len(result_df) == 3  # SimpleCommand creates 3 rows
 
 
+def test_data_pipeline_step_rows_chain_between_steps():
+    """Test that each step's input_rows equals the previous step's output_rows."""
+    class DropFirstRowCommand(PipelineCommand):
+        def process(self, df: pd.DataFrame, context=None) -> CommandResult:
+            return CommandResult(return_code=0, data=df.iloc[1:])
+
+    collector = MetadataCollector(pipeline_name="row_chain_pipeline")
+    pipeline = DataPipeline([SimpleCommand(), DropFirstRowCommand(), DropFirstRowCommand()], collector=collector)
+
+    pipeline.run()
+
+    steps = collector.get_pipeline_metadata().steps
+    assert [(s.input_rows, s.output_rows) for s in steps] == [(0, 3), (3, 2), (2, 1)]
+
+
 def test_data_pipeline_saves_metadata_automatically():
     """Test that DataPipeline automatically saves metadata when repository provided."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -120,3 +135,29 @@ def test_data_pipeline_saves_metadata_automatically():
             assert loaded.steps[0].result_code == -1
             assert loaded.steps[0].error is not None
             assert loaded.steps[0].error.get("message") == "simulated failure"
+
+
+def test_data_pipeline_names_duck_typed_commands_and_tracks_command_changes():
+    """Test that commands not subclassing PipelineCommand still run and get their class name."""
+    class PlainCommand:
+        def process(self, df, context=None) -> CommandResult:
+            return CommandResult(return_code=0, data=df)
+
+    pipeline = DataPipeline([SimpleCommand()])
+    pipeline.commands.append(PlainCommand())
+
+    pipeline.run()
+
+    assert pipeline.step_names == ("SimpleCommand", "PlainCommand")
+    assert [step.name for step in pipeline.collector.get_pipeline_metadata().steps] == ["SimpleCommand", "PlainCommand"]
+
+
+def test_data_pipeline_keeps_step_name_declared_by_subclass():
+    """Test that a subclass declaring its own step_name is not overwritten by the class name."""
+    class NamedCommand(SimpleCommand):
+        step_name = "custom_step"
+
+    class UnnamedChild(NamedCommand):
+        pass
+
+    assert DataPipeline([NamedCommand(), UnnamedChild()]).step_names == ("custom_step", "UnnamedChild")
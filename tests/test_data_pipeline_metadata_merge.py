@@ -1,9 +1,12 @@
 """TDD: Tests for DataPipeline merging metadata_updates from commands."""
 import pytest
 import pandas as pd
-from analyzer.pipeline.pipeline_commands import DataPipeline, QualityAnalysisCommand
+from analyzer.pipeline.pipeline_commands import DataPipeline, PipelineCommand, QualityAnalysisCommand
+from analyzer.pipeline.command_result import CommandResult
 from analyzer.pipeline.quality import SimpleQualityCalculator
 
+pytestmark = pytest.mark.usefixtures("disable_logging_without_caplog")
+
 
 def test_data_pipeline_merges_metadata_updates_from_command():
     """Test that DataPipeline merges metadata_updates from CommandResult into final metadata."""
@@ -29,7 +32,7 @@ def test_data_pipeline_merges_metadata_updates_from_command():
     result_df = pipeline.run(initial_df=df, repository=repository)
     
     # Verify result DataFrame is unchanged
-    assert result_df.equals(df)
+    assert result_df is df
     
     # Verify metadata was saved
     assert repository.saved_metadata is not None
@@ -72,3 +75,23 @@ def test_data_pipeline_metadata_updates_in_steps():
     assert quality_step is not None
     assert quality_step['input_rows'] == 2
     assert quality_step['output_rows'] == 2
+
+
+def test_data_pipeline_later_metadata_updates_override_earlier():
+    """Test that metadata_updates from later steps win for repeated keys."""
+    class TagCommand(PipelineCommand):
+        def __init__(self, updates):
+            self.updates = updates
+
+        def process(self, df, context=None) -> CommandResult:
+            return CommandResult(return_code=0, data=df, metadata_updates=self.updates)
+
+    pipeline = DataPipeline(commands=[
+        TagCommand({'quality_index': 0.5, 'calculator_name': 'first'}),
+        TagCommand({'quality_index': 0.9}),
+    ])
+    pipeline.run(initial_df=pd.DataFrame({'a': [1]}))
+
+    metadata = pipeline.collector.get_pipeline_metadata()
+    assert metadata.quality_index == 0.9
+    assert metadata.calculator_name == 'first'
@@ -0,0 +1,176 @@
+"""Tests for DataPipeline step result caching."""
+from dataclasses import dataclass
+
+import pandas as pd
+import pytest
+from analyzer.pipeline.pipeline_commands import ApplyFunctionsCommand, DataPipeline, PipelineCommand, QualityAnalysisCommand
+from analyzer.pipeline.command_result import CommandResult
+from analyzer.pipeline.quality import SimpleQualityCalculator
+from analyzer.pipeline.step_cache import StepCache, fingerprint_dataframe
+
+
+class CountingQualityCalculator(SimpleQualityCalculator):
+    """SimpleQualityCalculator that counts how often it actually calculated."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def calculate(self, df):
+        self.calls += 1
+        return super().calculate(df)
+
+
+class CountingCommand(PipelineCommand):
+    """Doubles a column and counts how often it actually ran."""
+
+    def __init__(self, cacheable=True):
+        self.calls = 0
+        self.cacheable = cacheable
+
+    def process(self, df, context=None) -> CommandResult:
+        self.calls += 1
+        return CommandResult(return_code=0, data=df.assign(value=df["value"] * 2))
+
+    def fingerprint(self):
+        return ("CountingCommand",) if self.cacheable else None
+
+
+def test_step_cache_skips_command_for_identical_input():
+    """Test that a repeated run with the same input reuses the cached step result."""
+    command = CountingCommand()
+    pipeline = DataPipeline([command], step_cache=StepCache())
+    df = pd.DataFrame({"value": [1, 2, 3]})
+
+    first = pipeline.run(df)
+    second = pipeline.run(df.copy())
+
+    assert command.calls == 1
+    assert second.equals(first)
+    assert second is not first
+
+
+def test_step_cache_recomputes_when_input_changes():
+    """Test that different input content misses the cache."""
+    command = CountingCommand()
+    pipeline = DataPipeline([command], step_cache=StepCache())
+
+    pipeline.run(pd.DataFrame({"value": [1, 2, 3]}))
+    result = pipeline.run(pd.DataFrame({"value": [1, 2, 4]}))
+
+    assert command.calls == 2
+    assert result["value"].tolist() == [2, 4, 8]
+
+
+def test_step_cache_recomputes_when_context_changes():
+    """Test that the same frame under a different pipeline context misses the cache."""
+    command = CountingCommand()
+    cache = StepCache()
+    df = pd.DataFrame({"value": [1, 2, 3]})
+
+    DataPipeline([command], context={"categories": "a.json"}, step_cache=cache).run(df)
+    DataPipeline([command], context={"categories": "b.json"}, step_cache=cache).run(df)
+    DataPipeline([command], context={"categories": "a.json"}, step_cache=cache).run(df)
+
+    assert command.calls == 2
+
+
+def test_step_cache_ignores_commands_without_fingerprint():
+    """Test that commands opting out of caching always run."""
+    command = CountingCommand(cacheable=False)
+    cache = StepCache()
+    pipeline = DataPipeline([command], step_cache=cache)
+    df = pd.DataFrame({"value": [1, 2, 3]})
+
+    pipeline.run(df)
+    pipeline.run(df)
+
+    assert command.calls == 2
+    assert len(cache) == 0
+
+
+def test_step_cache_runs_duck_typed_commands_uncached():
+    """Test that commands without a fingerprint method run instead of raising."""
+    class DuckCommand:
+        def process(self, df, context=None):
+            return CommandResult(return_code=0, data=df.assign(value=df["value"] + 1))
+
+    cache = StepCache()
+    result = DataPipeline([DuckCommand()], step_cache=cache).run(pd.DataFrame({"value": [1]}))
+
+    assert result["value"].tolist() == [2]
+    assert len(cache) == 0
+
+
+def test_fingerprint_dataframe_distinguishes_object_cell_types():
+    """Test that object cells equal as strings but of different types do not collide."""
+    assert fingerprint_dataframe(pd.DataFrame({"x": [1, "a"]})) != fingerprint_dataframe(pd.DataFrame({"x": ["1", "a"]}))
+    assert fingerprint_dataframe(pd.DataFrame({"x": [0]}, index=pd.Index([1], dtype=object))) != fingerprint_dataframe(
+        pd.DataFrame({"x": [0]}, index=pd.Index(["1"], dtype=object))
+    )
+    assert fingerprint_dataframe(pd.DataFrame({"x": [1, "a"]})) == fingerprint_dataframe(pd.DataFrame({"x": [1, "a"]}))
+
+
+def test_step_cache_evicts_least_recently_used():
+    """Test that the cache stays within maxsize."""
+    command = CountingCommand()
+    cache = StepCache(maxsize=1)
+    pipeline = DataPipeline([command], step_cache=cache)
+
+    pipeline.run(pd.DataFrame({"value": [1]}))
+    pipeline.run(pd.DataFrame({"value": [2]}))
+    pipeline.run(pd.DataFrame({"value": [1]}))
+
+    assert command.calls == 3
+    assert len(cache) == 1
+
+
+def test_apply_functions_fingerprint_tracks_functions():
+    """Test that ApplyFunctionsCommand fingerprints differ by function list."""
+    def add_one(df):
+        return df + 1
+
+    assert ApplyFunctionsCommand([add_one], cacheable=True).fingerprint() == ApplyFunctionsCommand([add_one], cacheable=True).fingerprint()
+    assert ApplyFunctionsCommand([add_one], cacheable=True).fingerprint() != ApplyFunctionsCommand(cacheable=True).fingerprint()
+
+
+def test_apply_functions_is_not_cached_by_default():
+    """Test that ApplyFunctionsCommand only caches when its functions are declared pure."""
+    def add_one(df):
+        return df + 1
+
+    assert ApplyFunctionsCommand([add_one]).fingerprint() is None
+
+
+def test_step_cache_reuses_quality_analysis_for_identical_input():
+    """Test that quality metrics are not recalculated for an identical frame and calculator."""
+    calculator = CountingQualityCalculator()
+    cache = StepCache()
+    df = pd.DataFrame({
+        "CategoryAnnotation": ["Food", "Income"],
+        "SubCategoryAnnotation": ["Coffee", "Salary"],
+        "Confidence": [0.9, 0.8],
+    })
+
+    DataPipeline([QualityAnalysisCommand(calculator=calculator)], step_cache=cache).run(df)
+    pipeline = DataPipeline([QualityAnalysisCommand(calculator=calculator)], step_cache=cache)
+    pipeline.run(df.copy())
+
+    assert calculator.calls == 1
+    assert pipeline.collector.get_pipeline_metadata().quality_index == pytest.approx(0.85)
+    assert QualityAnalysisCommand(calculator=CountingQualityCalculator()).fingerprint() != QualityAnalysisCommand(calculator=calculator).fingerprint()
+
+
+def test_step_cache_runs_quality_analysis_with_unhashable_calculator():
+    """Test that an unhashable calculator disables caching instead of failing the run."""
+    @dataclass
+    class DataclassQualityCalculator(SimpleQualityCalculator):
+        label: str = "dc"
+
+    cache = StepCache()
+    df = pd.DataFrame({"CategoryAnnotation": ["Food"], "SubCategoryAnnotation": ["Coffee"], "Confidence": [0.9]})
+    pipeline = DataPipeline([QualityAnalysisCommand(calculator=DataclassQualityCalculator())], step_cache=cache)
+
+    pipeline.run(df)
+
+    assert len(cache) == 0
+    assert pipeline.collector.get_pipeline_metadata().quality_index is not None
@@ -1,3 +1,5 @@
+import warnings
+
 import pandas as pd
 import pytest
 from analyzer.workflows.derive_statement_features import derive_statement_features
@@ -330,4 +332,160 @@ def test_all_expected_features_present(comprehensive_test_data):
     ]
     
     for feature in expected_features:
-        assert feature in result.columns, f"Expected feature {feature} not found"
\ No newline at end of file
+        assert feature in result.columns, f"Expected feature {feature} not found"
+
+
+def test_calendar_features_use_compact_dtypes(comprehensive_test_data):
+    """Test that calendar features are stored as small integer dtypes."""
+    result = derive_statement_features(comprehensive_test_data)
+
+    assert result['Year'].dtype == 'int16'
+    for col in ['Month', 'Day', 'DayOfWeek', 'WeekOfYear', 'WeekOfMonth', 'Quarter', 'Semester']:
+        assert result[col].dtype == 'int8', f"{col} should be int8, got {result[col].dtype}"
+    assert result['IsWeekend'].dtype == bool
+    for col in ['RunningCount', 'RunningCountYear', 'RunningCountMonth']:
+        assert result[col].dtype == 'uint32', f"{col} should be uint32, got {result[col].dtype}"
+
+
+def test_transaction_date_parsing_falls_back_for_other_layouts():
+    """Test that non dd/mm/yyyy dates parse as pandas infers them and garbage becomes NaT."""
+    df = pd.DataFrame({
+        'TransactionDate': ['15/12/2024', '2024-03-05', 'not a date'],
+        'TransactionValue': [1.0, 2.0, 3.0],
+        'TransactionNumber': [1, 2, 3],
+    })
+
+    result = derive_statement_features(df)
+
+    assert result.loc[0, 'TransactionDate'] == pd.Timestamp('2024-12-15')
+    # ISO dates keep their year-month-day reading rather than being read day-first
+    assert result.loc[1, 'TransactionDate'] == pd.Timestamp('2024-03-05')
+    assert pd.isna(result.loc[2, 'TransactionDate'])
+    assert pd.isna(result.loc[2, 'Year'])
+
+
+def test_transaction_date_parsing_of_iso_only_column():
+    """Test that a column of ISO dates parses instead of becoming all NaT."""
+    df = pd.DataFrame({
+        'TransactionDate': ['2024-12-25', '2024-12-26'],
+        'TransactionValue': [1.0, 2.0],
+        'TransactionNumber': [1, 2],
+    })
+
+    result = derive_statement_features(df)
+
+    assert result['TransactionDate'].tolist() == [pd.Timestamp('2024-12-25'), pd.Timestamp('2024-12-26')]
+    assert result['Day'].tolist() == [25, 26]
+
+
+def test_transaction_date_parsing_reads_other_separators_day_first():
+    """Test that dash, dot and whitespace-padded day-first dates keep day before month."""
+    df = pd.DataFrame({
+        'TransactionDate': ['03-04-2023', '13.04.2023', '03/04/2023 ', ' 04/03/2023', '5 /12/2024'],
+        'TransactionValue': [1.0] * 5,
+        'TransactionNumber': range(1, 6),
+    })
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = derive_statement_features(df)
+
+    assert result['TransactionDate'].tolist() == [
+        pd.Timestamp('2023-04-03'), pd.Timestamp('2023-04-13'), pd.Timestamp('2023-04-03'),
+        pd.Timestamp('2023-03-04'), pd.Timestamp('2024-12-05'),
+    ]
+
+
+def test_transaction_date_parsing_rejects_malformed_and_out_of_range_dates():
+    """Test that non-digit fields and dates outside the datetime64[ns] range become NaT, not wrapped timestamps."""
+    dates = ['25/12/-024', '01/01/2300', '25/12/0001', '05/12/ 024', '22/09/1677', '11/04/2262', '15/12/2024']
+    df = pd.DataFrame({
+        'TransactionDate': dates,
+        'TransactionValue': [1.0] * len(dates),
+        'TransactionNumber': range(1, len(dates) + 1),
+    })
+
+    result = derive_statement_features(df)
+
+    assert result['TransactionDate'].iloc[:4].isna().all()
+    assert result['Year'].iloc[:4].isna().all()
+    assert result['TransactionDate'].iloc[4:].tolist() == [
+        pd.Timestamp('1677-09-22'), pd.Timestamp('2262-04-11'), pd.Timestamp('2024-12-15')
+    ]
+
+
+def test_calendar_fields_match_pandas_around_epoch_and_leap_days():
+    """Test calendar fields on dates before the epoch, on leap days and at year ends."""
+    dates = ['31/12/1969', '01/01/1970', '29/02/2024', '31/12/2024', '01/03/1900']
+    df = pd.DataFrame({
+        'TransactionDate': dates,
+        'TransactionValue': [1.0] * len(dates),
+        'TransactionNumber': range(1, len(dates) + 1),
+    })
+
+    result = derive_statement_features(df)
+
+    expected = pd.to_datetime(pd.Series(dates), format='%d/%m/%Y')
+    assert result['Year'].tolist() == expected.dt.year.tolist()
+    assert result['Month'].tolist() == expected.dt.month.tolist()
+    assert result['Day'].tolist() == expected.dt.day.tolist()
+    assert result['DayOfWeek'].tolist() == expected.dt.dayofweek.tolist()
+    assert result['Quarter'].tolist() == expected.dt.quarter.tolist()
+
+
+def test_running_totals_with_interleaved_groups_and_missing_value():
+    """Test per-year running totals when years interleave and a value is missing."""
+    df = pd.DataFrame({
+        'TransactionDate': ['01/01/2023', '01/01/2024', '02/01/2023', '02/01/2024', '03/01/2023'],
+        'TransactionValue': [10.0, 100.0, float('nan'), 200.0, 30.0],
+        'TransactionNumber': [1, 2, 3, 4, 5],
+    })
+
+    result = derive_statement_features(df)
+
+    assert result['RunningSumYear'].tolist()[:2] == [10.0, 100.0]
+    assert pd.isna(result.loc[2, 'RunningSumYear'])
+    assert result['RunningSumYear'].tolist()[3:] == [300.0, 40.0]
+    assert result['RunningCountYear'].tolist() == [1, 1, 2, 2, 3]
+
+
+def test_running_totals_keep_row_order_for_equal_transaction_numbers():
+    """Test that rows sharing a TransactionNumber accumulate in their original order."""
+    df = pd.DataFrame({
+        'TransactionDate': ['01/01/2024'] * 4,
+        'TransactionValue': [1.0, 2.0, 4.0, 8.0],
+        'TransactionNumber': [2, 1, 2, 1],
+    })
+
+    result = derive_statement_features(df)
+
+    assert result['RunningSum'].tolist() == [11.0, 2.0, 15.0, 10.0]
+
+
+def test_transaction_value_bin_dtype_is_fixed_across_inputs():
+    """Test that every call shares one ordered bin dtype, whatever bins the data hits."""
+    small = pd.DataFrame({'TransactionDate': ['01/01/2024'], 'TransactionValue': [5.0], 'TransactionNumber': [1]})
+    large = pd.DataFrame({'TransactionDate': ['01/01/2024'], 'TransactionValue': [5000.0], 'TransactionNumber': [1]})
+
+    small_bin = derive_statement_features(small)['TransactionValueBin']
+    large_bin = derive_statement_features(large)['TransactionValueBin']
+
+    assert small_bin.dtype == large_bin.dtype
+    assert small_bin.cat.ordered
+    assert small_bin.cat.categories.tolist() == ['0-10', '10.01-50', '50.01-150', '150.01-500', '500.01-1500', '1500+']
+
+
+def test_empty_dataframe_returns_all_feature_columns():
+    """Test that an empty input still yields every derived column with its dtype."""
+    empty = pd.DataFrame({'TransactionDate': [], 'TransactionValue': [], 'TransactionNumber': []})
+
+    result = derive_statement_features(empty)
+
+    assert result.empty
+    assert result['Year'].dtype == 'int16'
+    assert result['IsWeekend'].dtype == bool
+    assert result['TransactionValueBin'].cat.categories.tolist() == [
+        '0-10', '10.01-50', '50.01-150', '150.01-500', '500.01-1500', '1500+'
+    ]
+    for col in ['RunningSum', 'RunningCountYear', 'RunningAverageMonth']:
+        assert col in result.columns
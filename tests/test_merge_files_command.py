@@ -1,19 +1,15 @@
 import pytest
 import pandas as pd
-from tempfile import NamedTemporaryFile
-import sys
-from pathlib import Path
+from analyzer.pipeline.pipeline_commands import MergeTrainnedDataCommand
 
-# Add the src directory to the Python path
-sys.path.append(str(Path(__file__).resolve().parents[1] / 'src'))
+pytestmark = pytest.mark.usefixtures("disable_logging_without_caplog")
 
-from analyzer.pipeline.pipeline_commands import MergeTrainnedDataCommand
 
-def test_merge_files_command_updates_categories_from_training_data(test_csv_files):
+@pytest.mark.filterwarnings("error::pandas.errors.PerformanceWarning")
+def test_merge_files_command_updates_categories_from_training_data(test_csv_files, test_csv_dataframes):
     """Test that MergeTrainnedDataCommand correctly merges training data into transaction data."""
     # Arrange
-    data_df = pd.read_csv(test_csv_files['file1'])
-    training_df = pd.read_csv(test_csv_files['training'])
+    data_df = test_csv_dataframes['file1']
     merge_command = MergeTrainnedDataCommand(input_file=test_csv_files['training'], on_columns=['TransactionNumber'])
 
     # Act
@@ -26,19 +22,12 @@ def test_merge_files_command_updates_categories_from_training_data(test_csv_file
 
     result_df = result.data
 
-    # Assert merge behavior: all transaction numbers from original data are present
+    # Assert merge behavior: row order preserved and every transaction annotated from training data
     assert len(result_df) == len(data_df), "Row count should be preserved after merge"
-    assert set(result_df['TransactionNumber']) == set(data_df['TransactionNumber']), \
-        "Transaction numbers should match original data"
-
-    # Assert that categories were updated (not None and have meaningful values)
-    updated_rows = result_df[result_df['TransactionNumber'].isin(training_df['TransactionNumber'])]
-    assert len(updated_rows) > 0, "Some rows should be updated from training data"
-    assert updated_rows['CategoryAnnotation'].notna().all(), \
-        "Updated rows should have category annotations"
-    assert updated_rows['SubCategoryAnnotation'].notna().all(), \
-        "Updated rows should have subcategory annotations"
-    assert updated_rows['Confidence'].notna().all(), \
-        "Updated rows should have confidence values"
-    assert (updated_rows['Confidence'] > 0).all() and (updated_rows['Confidence'] <= 1).all(), \
-        "Confidence values should be between 0 and 1"
+    expected = pd.DataFrame({
+        'TransactionNumber': data_df['TransactionNumber'],
+        'CategoryAnnotation': ['Food & Dining', 'Income', 'Food & Dining'],
+        'SubCategoryAnnotation': ['Coffee Shops', 'Salary', 'Groceries'],
+        'Confidence': [0.90, 0.95, 0.88],
+    })
+    pd.testing.assert_frame_equal(result_df[expected.columns].reset_index(drop=True), expected)
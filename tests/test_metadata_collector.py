@@ -1,9 +1,25 @@
 """Test for MetadataCollector - collects metadata during pipeline execution."""
+import itertools
 import pytest
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from analyzer.pipeline import metadata as metadata_module
 from analyzer.pipeline.metadata import MetadataCollector, StepMetadata, PipelineMetadata
 
+pytestmark = pytest.mark.usefixtures("disable_logging_without_caplog")
+
+
+@pytest.fixture
+def ticking_clock(monkeypatch):
+    """Make every datetime.now() in the metadata module one second later than the last."""
+    ticks = itertools.count()
+
+    class _TickingDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2025, 1, 1, tzinfo=tz) + timedelta(seconds=next(ticks))
+
+    monkeypatch.setattr(metadata_module, "datetime", _TickingDatetime)
+
 
 def test_metadata_collector_creation():
     """Test that MetadataCollector can be created."""
@@ -24,35 +40,36 @@ def test_metadata_collector_start_pipeline():
     assert collector.pipeline_metadata.start_time is not None
 
 
-def test_metadata_collector_end_pipeline():
+def test_metadata_collector_end_pipeline(ticking_clock):
     """Test ending pipeline metadata collection."""
     collector = MetadataCollector(pipeline_name="test_pipeline")
     collector.start_pipeline()
-    
-    time.sleep(0.01)  # Small delay to ensure some time passes
     collector.end_pipeline()
     
     assert collector.pipeline_metadata.end_time is not None
     assert collector.pipeline_metadata.total_duration > 0
 
 
-def test_metadata_collector_track_step():
-    """Test tracking a step's metadata."""
+@pytest.mark.parametrize("steps", [
+    [("AppendFilesCommand", 0, 1000, 1.5, {"input_dir": "/data"})],
+    [("Step1", 0, 100, 0.5, {}), ("Step2", 100, 90, 0.3, {}), ("Step3", 90, 90, 0.2, {})],
+], ids=["single", "multiple"])
+def test_metadata_collector_tracks_steps(steps):
+    """Test tracking steps and retrieving the collected pipeline metadata."""
     collector = MetadataCollector(pipeline_name="test_pipeline")
     collector.start_pipeline()
     
-    step = StepMetadata(
-        name="AppendFilesCommand",
-        input_rows=0,
-        output_rows=1000,
-        duration=1.5,
-        parameters={"input_dir": "/data"}
-    )
+    for step in steps:
+        collector.track_step(StepMetadata(*step))
     
-    collector.track_step(step)
+    collector.end_pipeline()
     
-    assert len(collector.pipeline_metadata.steps) == 1
-    assert collector.pipeline_metadata.steps[0].name == "AppendFilesCommand"
+    metadata = collector.get_pipeline_metadata()
+    
+    assert isinstance(metadata, PipelineMetadata)
+    assert metadata.pipeline_name == "test_pipeline"
+    assert [step.name for step in metadata.steps] == [step[0] for step in steps]
+    assert metadata.output_rows == steps[-1][2]
 
 
 def test_metadata_collector_step_includes_result_code():
@@ -75,41 +92,6 @@ def test_metadata_collector_step_includes_result_code():
     assert collector.pipeline_metadata.steps[0].result_code == -1
 
 
-def test_metadata_collector_multiple_steps():
-    """Test tracking multiple steps."""
-    collector = MetadataCollector(pipeline_name="test_pipeline")
-    collector.start_pipeline()
-    
-    step1 = StepMetadata("Step1", input_rows=0, output_rows=100, duration=0.5, parameters={})
-    step2 = StepMetadata("Step2", input_rows=100, output_rows=90, duration=0.3, parameters={})
-    step3 = StepMetadata("Step3", input_rows=90, output_rows=90, duration=0.2, parameters={})
-    
-    collector.track_step(step1)
-    collector.track_step(step2)
-    collector.track_step(step3)
-    
-    assert len(collector.pipeline_metadata.steps) == 3
-    assert collector.pipeline_metadata.steps[1].name == "Step2"
-
-
-def test_metadata_collector_get_pipeline_metadata():
-    """Test retrieving the collected pipeline metadata."""
-    collector = MetadataCollector(pipeline_name="test_pipeline")
-    collector.start_pipeline()
-    
-    step = StepMetadata("Step1", input_rows=0, output_rows=100, duration=1.0, parameters={})
-    collector.track_step(step)
-    
-    collector.end_pipeline()
-    
-    metadata = collector.get_pipeline_metadata()
-    
-    assert isinstance(metadata, PipelineMetadata)
-    assert metadata.pipeline_name == "test_pipeline"
-    assert len(metadata.steps) == 1
-    assert metadata.output_rows == 100
-
-
 def test_metadata_collector_context_manager():
     """Test using MetadataCollector as a context manager."""
     with MetadataCollector(pipeline_name="context_pipeline") as collector:
@@ -124,11 +106,10 @@ def test_metadata_collector_context_manager():
     assert metadata.total_duration > 0
 
 
-def test_metadata_collector_without_steps():
+def test_metadata_collector_without_steps(ticking_clock):
     """Test metadata collection for pipeline with no steps."""
     collector = MetadataCollector(pipeline_name="empty_pipeline")
     collector.start_pipeline()
-    time.sleep(0.01)
     collector.end_pipeline()
     
     metadata = collector.get_pipeline_metadata()
@@ -1,15 +1,21 @@
 """Test MetadataCollector with optional PipelineMetadata parameter."""
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from analyzer.pipeline.metadata import MetadataCollector, PipelineMetadata, StepMetadata
 
+pytestmark = pytest.mark.usefixtures("disable_logging_without_caplog")
+
+T0 = datetime(2025, 10, 26, 10, 0, 0)
+T1 = T0 + timedelta(seconds=1)
+T5 = T0 + timedelta(seconds=5)
+
 
 def test_metadata_collector_accepts_pipeline_metadata():
     """Test that MetadataCollector can accept an optional PipelineMetadata instance."""
     existing_metadata = PipelineMetadata(
         pipeline_name="existing_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 1)
+        start_time=T0,
+        end_time=T1
     )
     
     collector = MetadataCollector(
@@ -37,8 +43,8 @@ def test_metadata_collector_uses_provided_metadata():
     """Test that provided metadata is used when starting pipeline."""
     existing_metadata = PipelineMetadata(
         pipeline_name="reused_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 1)
+        start_time=T0,
+        end_time=T1
     )
     original_run_id = existing_metadata.run_id
     
@@ -59,8 +65,8 @@ def test_metadata_collector_adds_steps_to_provided_metadata():
     """Test that steps added to collector are added to provided metadata."""
     existing_metadata = PipelineMetadata(
         pipeline_name="pipeline_with_steps",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 5)
+        start_time=T0,
+        end_time=T5
     )
     
     collector = MetadataCollector(
@@ -1,13 +1,20 @@
 """Test for MetadataRepository - saves and loads metadata persistently."""
+import os
 import pytest
-import json
+import orjson
+import numpy as np
 import tempfile
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from analyzer.pipeline.metadata import (
     MetadataRepository, MetadataCollector, StepMetadata, PipelineMetadata
 )
 
+pytestmark = pytest.mark.usefixtures("disable_logging_without_caplog")
+
+T0 = datetime(2025, 10, 26, 10, 0, 0)
+T5 = T0 + timedelta(seconds=5)
+
 
 def test_metadata_repository_persists_and_retrieves_metadata(temp_dir):
     """Test the core contract: repository saves and loads metadata identically."""
@@ -16,8 +23,8 @@ def test_metadata_repository_persists_and_retrieves_metadata(temp_dir):
     # Create rich pipeline metadata
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 5),
+        start_time=T0,
+        end_time=T5,
         quality_index=0.92
     )
     
@@ -65,8 +72,8 @@ def test_metadata_repository_persist_step_result_code(temp_dir):
 
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 5),
+        start_time=T0,
+        end_time=T5,
     )
 
     step = StepMetadata(
@@ -93,8 +100,8 @@ def test_metadata_repository_save_and_load(temp_dir):
     # Create pipeline metadata
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 5)
+        start_time=T0,
+        end_time=T5
     )
     
     step = StepMetadata(
@@ -124,17 +131,17 @@ def test_metadata_repository_list_runs(temp_dir):
     repo = MetadataRepository(storage_path=Path(temp_dir))
     
     # Save multiple pipelines
-    for i in range(3):
-        pipeline = PipelineMetadata(
-            pipeline_name=f"pipeline_{i}",
-            start_time=datetime.now(),
-            end_time=datetime.now()
-        )
-        repo.save(pipeline)
+    now = datetime.now()
+    pipelines = [
+        PipelineMetadata(pipeline_name=f"pipeline_{i}", start_time=now, end_time=now)
+        for i in range(3)
+    ]
+    saved_ids = [repo.save(pipeline) for pipeline in pipelines]
     
     runs = repo.list_runs()
     
     assert len(runs) == 3
+    assert sorted(saved_ids) == runs
     # Verify all are strings (run IDs)
     assert all(isinstance(run_id, str) for run_id in runs)
 
@@ -152,8 +159,8 @@ def test_metadata_repository_metadata_content(temp_dir):
     """Test that saved metadata preserves all data."""
     repo = MetadataRepository(storage_path=Path(temp_dir))
     
-    start_time = datetime(2025, 10, 26, 10, 0, 0)
-    end_time = datetime(2025, 10, 26, 10, 0, 5)
+    start_time = T0
+    end_time = T5
     
     pipeline = PipelineMetadata(
         pipeline_name="complex_pipeline",
@@ -189,3 +196,73 @@ def test_metadata_repository_metadata_content(temp_dir):
     assert loaded.steps[0].name == "Append"
     assert loaded.steps[1].name == "Clean"
     assert loaded.steps[0].parameters["dir"] == "/data"
+
+
+def test_metadata_repository_saves_numpy_values_as_indented_json(temp_dir):
+    """Test that numpy scalars in metadata are persisted and the file stays indented JSON."""
+    repo = MetadataRepository(storage_path=Path(temp_dir))
+    pipeline = PipelineMetadata(
+        pipeline_name="test_pipeline",
+        start_time=T0,
+        end_time=T5,
+        quality_index=np.float64(0.875),
+    )
+    pipeline.add_step(StepMetadata("Step1", input_rows=np.int64(3), output_rows=3, duration=0.1, parameters={}))
+
+    run_id = repo.save(pipeline)
+
+    raw = (Path(temp_dir) / f"{run_id}.json").read_bytes()
+    assert orjson.loads(raw)["quality_index"] == 0.875
+    assert b'\n  "pipeline_name"' in raw
+    assert repo.load(run_id).steps[0].input_rows == 3
+
+
+def test_metadata_repository_save_overwrites_without_leaving_temp_files(temp_dir):
+    """Test that re-saving a run replaces its file and leaves only the .json behind."""
+    repo = MetadataRepository(storage_path=Path(temp_dir))
+    pipeline = PipelineMetadata(pipeline_name="test_pipeline", start_time=T0, end_time=T5)
+
+    run_id = repo.save(pipeline)
+    pipeline.result_code = -1
+    repo.save(pipeline)
+
+    assert [p.name for p in Path(temp_dir).iterdir()] == [f"{run_id}.json"]
+    assert repo.load(run_id).result_code == -1
+
+
+def test_metadata_repository_list_runs_sees_new_saves(temp_dir):
+    """Test that list_runs reflects saves made after an earlier listing."""
+    repo = MetadataRepository(storage_path=Path(temp_dir))
+    first = repo.save(PipelineMetadata(pipeline_name="first", start_time=T0, end_time=T5))
+
+    assert repo.list_runs() == [first]
+
+    second = repo.save(PipelineMetadata(pipeline_name="second", start_time=T0, end_time=T5))
+
+    assert repo.list_runs() == sorted([first, second])
+
+
+def test_metadata_repository_list_runs_sees_files_written_in_the_same_mtime_tick(temp_dir):
+    """Test that a run file added without changing the directory mtime is still listed."""
+    repo = MetadataRepository(storage_path=Path(temp_dir))
+    first = repo.save(PipelineMetadata(pipeline_name="first", start_time=T0, end_time=T5))
+    mtime_ns = Path(temp_dir).stat().st_mtime_ns
+
+    assert repo.list_runs() == [first]
+
+    # Another process writes a run within the same mtime tick
+    (Path(temp_dir) / "other.json").write_bytes(b"{}")
+    os.utime(temp_dir, ns=(mtime_ns, mtime_ns))
+
+    assert repo.list_runs() == sorted([first, "other"])
+
+
+def test_metadata_repository_list_runs_caches_settled_directory(temp_dir):
+    """Test that a directory untouched for longer than the mtime granularity is not rescanned."""
+    repo = MetadataRepository(storage_path=Path(temp_dir))
+    first = repo.save(PipelineMetadata(pipeline_name="first", start_time=T0, end_time=T5))
+    settled_ns = Path(temp_dir).stat().st_mtime_ns - 10_000_000_000
+    os.utime(temp_dir, ns=(settled_ns, settled_ns))
+
+    assert repo.list_runs() == [first]
+    assert repo._runs_cache == (settled_ns, [first])
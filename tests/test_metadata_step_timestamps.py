@@ -6,6 +6,8 @@ from analyzer.pipeline.pipeline_commands import DataPipeline, PipelineCommand
 from analyzer.pipeline.command_result import CommandResult
 from analyzer.pipeline.metadata import MetadataCollector
 
+pytestmark = pytest.mark.usefixtures("disable_logging_without_caplog")
+
 
 class SimpleCommand(PipelineCommand):
     """Simple test command."""
@@ -15,85 +17,59 @@ class SimpleCommand(PipelineCommand):
         return CommandResult(return_code=0, data=df)
 
 
-def test_step_metadata_has_start_time():
-    """Test that StepMetadata captures start_time."""
+def _run_and_collect(command_count: int):
     collector = MetadataCollector(pipeline_name="test_pipeline")
-    pipeline = DataPipeline([SimpleCommand()], collector=collector)
-    
-    # Create test data
-    df = pd.DataFrame({"col": [1, 2, 3]})
-    
-    # Run pipeline
-    pipeline.run(df)
-    
-    # Get metadata
-    metadata = collector.get_pipeline_metadata()
-    
-    # Verify start_time is populated
-    assert len(metadata.steps) == 1
-    assert metadata.steps[0].start_time is not None
-    assert isinstance(metadata.steps[0].start_time, datetime)
+    pipeline = DataPipeline([SimpleCommand() for _ in range(command_count)], collector=collector)
+    pipeline.run(pd.DataFrame({"col": [1, 2, 3]}))
+    return collector.get_pipeline_metadata()
+
+
+@pytest.fixture(scope="module")
+def single_step_metadata():
+    """Pipeline metadata from one single-step run, shared by the read-only tests below."""
+    return _run_and_collect(1)
 
 
-def test_step_metadata_has_end_time():
+@pytest.fixture(scope="module")
+def three_step_metadata():
+    """Pipeline metadata from one three-step run."""
+    return _run_and_collect(3)
+
+
+def test_step_metadata_has_start_time(single_step_metadata):
+    """Test that StepMetadata captures start_time."""
+    assert len(single_step_metadata.steps) == 1
+    assert isinstance(single_step_metadata.steps[0].start_time, datetime)
+
+
+def test_step_metadata_has_end_time(single_step_metadata):
     """Test that StepMetadata captures end_time."""
-    collector = MetadataCollector(pipeline_name="test_pipeline")
-    pipeline = DataPipeline([SimpleCommand()], collector=collector)
-    
-    # Create test data
-    df = pd.DataFrame({"col": [1, 2, 3]})
-    
-    # Run pipeline
-    pipeline.run(df)
-    
-    # Get metadata
-    metadata = collector.get_pipeline_metadata()
-    
-    # Verify end_time is populated
-    assert len(metadata.steps) == 1
-    assert metadata.steps[0].end_time is not None
-    assert isinstance(metadata.steps[0].end_time, datetime)
+    assert len(single_step_metadata.steps) == 1
+    assert isinstance(single_step_metadata.steps[0].end_time, datetime)
 
 
-def test_step_metadata_times_are_ordered():
+def test_step_metadata_times_are_ordered(single_step_metadata):
     """Test that start_time is before end_time."""
-    collector = MetadataCollector(pipeline_name="test_pipeline")
-    pipeline = DataPipeline([SimpleCommand()], collector=collector)
-    
-    # Create test data
-    df = pd.DataFrame({"col": [1, 2, 3]})
-    
-    # Run pipeline
-    pipeline.run(df)
-    
-    # Get metadata
-    metadata = collector.get_pipeline_metadata()
-    
-    # Verify ordering
-    step = metadata.steps[0]
+    step = single_step_metadata.steps[0]
     assert step.start_time < step.end_time
 
 
-def test_multiple_steps_have_timestamps():
+def test_multiple_steps_have_timestamps(three_step_metadata):
     """Test that all steps in a multi-step pipeline capture timestamps."""
-    collector = MetadataCollector(pipeline_name="test_pipeline")
-    pipeline = DataPipeline(
-        [SimpleCommand(), SimpleCommand(), SimpleCommand()],
-        collector=collector
-    )
-    
-    # Create test data
-    df = pd.DataFrame({"col": [1, 2, 3]})
-    
-    # Run pipeline
-    pipeline.run(df)
-    
-    # Get metadata
-    metadata = collector.get_pipeline_metadata()
-    
-    # Verify all steps have timestamps
-    assert len(metadata.steps) == 3
-    for i, step in enumerate(metadata.steps):
+    assert len(three_step_metadata.steps) == 3
+    for i, step in enumerate(three_step_metadata.steps):
         assert step.start_time is not None, f"Step {i} missing start_time"
         assert step.end_time is not None, f"Step {i} missing end_time"
         assert step.start_time < step.end_time, f"Step {i} times not ordered"
+
+
+def test_step_end_time_matches_measured_duration(single_step_metadata):
+    """Test that end_time is start_time plus the measured step duration."""
+    step = single_step_metadata.steps[0]
+    assert (step.end_time - step.start_time).total_seconds() == pytest.approx(step.duration, abs=1e-6)
+
+
+def test_step_start_times_follow_run_order(three_step_metadata):
+    """Test that each step starts no earlier than the previous step did."""
+    starts = [step.start_time for step in three_step_metadata.steps]
+    assert starts == sorted(starts)
@@ -1,13 +1,18 @@
 """Test for PipelineMetadata - captures metadata of entire pipeline execution."""
+import math
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from analyzer.pipeline.metadata import PipelineMetadata, StepMetadata
 
+T0 = datetime(2025, 10, 26, 10, 0, 0)
+T5 = T0 + timedelta(seconds=5)
+T5_5 = T0 + timedelta(seconds=5.5)
+
 
 def test_pipeline_metadata_calculates_duration():
     """Test that PipelineMetadata calculates total duration."""
-    start_time = datetime(2025, 10, 26, 10, 0, 0)
-    end_time = datetime(2025, 10, 26, 10, 0, 5, 500000)  # 5.5 seconds
+    start_time = T0
+    end_time = T5_5  # 5.5 seconds
     
     metadata = PipelineMetadata(
         pipeline_name="test_pipeline",
@@ -15,13 +20,13 @@ def test_pipeline_metadata_calculates_duration():
         end_time=end_time
     )
     
-    assert metadata.total_duration == pytest.approx(5.5, abs=0.01)
+    assert math.isclose(metadata.total_duration, 5.5, abs_tol=0.01)
 
 
 def test_pipeline_metadata_add_step():
     """Test adding step metadata to pipeline metadata."""
-    start_time = datetime(2025, 10, 26, 10, 0, 0)
-    end_time = datetime(2025, 10, 26, 10, 0, 5)
+    start_time = T0
+    end_time = T5
     
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
@@ -47,8 +52,8 @@ def test_pipeline_metadata_input_output_rows():
     """Test that PipelineMetadata tracks total input and output rows."""
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 5)
+        start_time=T0,
+        end_time=T5
     )
     
     step1 = StepMetadata("Step1", input_rows=0, output_rows=1000, duration=1.0, parameters={})
@@ -64,12 +69,51 @@ def test_pipeline_metadata_input_output_rows():
     assert pipeline.output_rows == 950
 
 
+def test_pipeline_metadata_explicit_rows_override_steps():
+    """Test that explicitly set row counts take precedence over step-derived ones."""
+    pipeline = PipelineMetadata(
+        pipeline_name="test_pipeline",
+        start_time=T0,
+        end_time=T5
+    )
+    assert pipeline.input_rows is None
+    assert pipeline.output_rows is None
+
+    pipeline.add_step(StepMetadata("Step1", input_rows=10, output_rows=8, duration=1.0, parameters={}))
+    pipeline.output_rows = 5
+
+    assert pipeline.input_rows == 10
+    assert pipeline.output_rows == 5
+
+
+def test_pipeline_metadata_later_step_replaces_explicit_output_rows():
+    """Test that adding a step after setting output_rows explicitly reports the new step's output."""
+    pipeline = PipelineMetadata(
+        pipeline_name="test_pipeline",
+        start_time=T0,
+        end_time=T5
+    )
+    pipeline.input_rows = 99
+    pipeline.output_rows = 5
+
+    pipeline.add_step(StepMetadata("Step1", input_rows=10, output_rows=8, duration=1.0, parameters={}))
+
+    assert pipeline.input_rows == 10
+    assert pipeline.output_rows == 8
+
+    pipeline.input_rows = 42
+    pipeline.add_step(StepMetadata("Step2", input_rows=8, output_rows=7, duration=1.0, parameters={}))
+
+    assert pipeline.input_rows == 42
+    assert pipeline.output_rows == 7
+
+
 def test_pipeline_metadata_quality_index():
     """Test that PipelineMetadata has a placeholder for quality_index."""
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
-        start_time=datetime(2025, 10, 26, 10, 0, 0),
-        end_time=datetime(2025, 10, 26, 10, 0, 5),
+        start_time=T0,
+        end_time=T5,
         quality_index=None  # Placeholder for now
     )
     
@@ -78,8 +122,8 @@ def test_pipeline_metadata_quality_index():
 
 def test_pipeline_metadata_to_dict():
     """Test that PipelineMetadata can be serialized to dict."""
-    start_time = datetime(2025, 10, 26, 10, 0, 0)
-    end_time = datetime(2025, 10, 26, 10, 0, 5)
+    start_time = T0
+    end_time = T5
     
     pipeline = PipelineMetadata(
         pipeline_name="test_pipeline",
@@ -95,6 +139,6 @@ def test_pipeline_metadata_to_dict():
     assert isinstance(metadata_dict, dict)
     assert metadata_dict["pipeline_name"] == "test_pipeline"
     assert "run_id" in metadata_dict
-    assert metadata_dict["total_duration"] == pytest.approx(5.0, abs=0.01)
+    assert math.isclose(metadata_dict["total_duration"], 5.0, abs_tol=0.01)
     assert len(metadata_dict["steps"]) == 1
     assert metadata_dict["steps"][0]["name"] == "Step1"
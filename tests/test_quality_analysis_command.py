@@ -1,38 +1,37 @@
 """TDD: Tests for QualityAnalysisCommand."""
+import math
 import pytest
 import pandas as pd
 from analyzer.pipeline.pipeline_commands import QualityAnalysisCommand
 from analyzer.pipeline.quality import SimpleQualityCalculator, QualityMetrics
 
 
-def test_quality_analysis_command_returns_command_result():
-    """Test that QualityAnalysisCommand returns CommandResult."""
-    df = pd.DataFrame({
+@pytest.fixture(scope="module")
+def annotated_df():
+    """Two fully annotated rows, shared read-only by the tests that request it."""
+    return pd.DataFrame({
         'CategoryAnnotation': ['Food', 'Transport'],
         'SubCategoryAnnotation': ['Coffee', 'Bus'],
         'Confidence': [0.95, 0.92]
     })
-    
+
+
+def test_quality_analysis_command_returns_command_result(annotated_df):
+    """Test that QualityAnalysisCommand returns CommandResult."""
     command = QualityAnalysisCommand(calculator=SimpleQualityCalculator())
-    result = command.process(df)
+    result = command.process(annotated_df)
     
     # Check CommandResult structure
     assert result.return_code == 0
     assert result.data is not None
     assert result.error is None
-    assert result.data.equals(df)  # Data should be unchanged
+    assert result.data is annotated_df  # Data is passed through untouched
 
 
-def test_quality_analysis_command_updates_metadata():
+def test_quality_analysis_command_updates_metadata(annotated_df):
     """Test that QualityAnalysisCommand populates metadata_updates."""
-    df = pd.DataFrame({
-        'CategoryAnnotation': ['Food', 'Transport'],
-        'SubCategoryAnnotation': ['Coffee', 'Bus'],
-        'Confidence': [0.95, 0.92]
-    })
-    
     command = QualityAnalysisCommand(calculator=SimpleQualityCalculator())
-    result = command.process(df)
+    result = command.process(annotated_df)
     
     assert result.metadata_updates is not None
     assert 'quality_index' in result.metadata_updates
@@ -41,13 +40,13 @@ def test_quality_analysis_command_updates_metadata():
     
     # Check values
     quality_index = result.metadata_updates['quality_index']
-    assert quality_index == pytest.approx(0.935, abs=0.001)  # (0.95 + 0.92) / 2
+    assert math.isclose(quality_index, 0.935, abs_tol=0.001)  # (0.95 + 0.92) / 2
     assert result.metadata_updates['calculator_name'] == 'SimpleQualityCalculator'
     
     # Check quality_metrics dict
     metrics_dict = result.metadata_updates['quality_metrics']
-    assert metrics_dict['overall_quality_index'] == pytest.approx(0.935, abs=0.001)
-    assert metrics_dict['confidence'] == pytest.approx(0.935, abs=0.001)
+    assert math.isclose(metrics_dict['overall_quality_index'], 0.935, abs_tol=0.001)
+    assert math.isclose(metrics_dict['confidence'], 0.935, abs_tol=0.001)
 
 
 def test_quality_analysis_command_with_missing_data():
@@ -62,7 +61,7 @@ def test_quality_analysis_command_with_missing_data():
     result = command.process(df)
     
     assert result.return_code == 0
-    assert result.metadata_updates['quality_index'] == pytest.approx(0.475, abs=0.001)  # (0.95 + 0) / 2
+    assert math.isclose(result.metadata_updates['quality_index'], 0.475, abs_tol=0.001)  # (0.95 + 0) / 2
 
 
 def test_quality_analysis_command_with_custom_calculator():
@@ -89,3 +88,25 @@ def test_quality_analysis_command_with_custom_calculator():
     
     assert result.metadata_updates['quality_index'] == 0.5
     assert result.metadata_updates['calculator_name'] == 'TestCalculator'
+
+
+def test_quality_analysis_command_with_duck_typed_calculator():
+    """Test that a calculator not subclassing QualityCalculator is reported by class name."""
+    class PlainCalculator:
+        def calculate(self, df):
+            return QualityMetrics(completeness=1.0, confidence=1.0, consistency=1.0, overall_quality_index=1.0)
+
+    result = QualityAnalysisCommand(calculator=PlainCalculator()).process(pd.DataFrame({'Confidence': [0.9]}))
+
+    assert result.return_code == 0
+    assert result.metadata_updates['calculator_name'] == 'PlainCalculator'
+
+
+def test_quality_analysis_command_reports_name_declared_by_calculator():
+    """Test that a calculator subclass declaring its own NAME keeps it."""
+    class NamedCalculator(SimpleQualityCalculator):
+        NAME = 'custom_calculator'
+
+    result = QualityAnalysisCommand(calculator=NamedCalculator()).process(pd.DataFrame({'Confidence': [0.9]}))
+
+    assert result.metadata_updates['calculator_name'] == 'custom_calculator'
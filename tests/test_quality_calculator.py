@@ -1,89 +1,39 @@
 """TDD: Tests for QualityCalculator interface and implementations."""
+import math
 import pytest
 import pandas as pd
-from analyzer.pipeline.quality import SimpleQualityCalculator, QualityMetrics
+from analyzer.pipeline.quality import EMPTY_METRICS, DefaultQualityCalculator, SimpleQualityCalculator, QualityMetrics
 
 
-def test_default_quality_calculator_with_all_valid_data():
-    """Test quality calculation with all valid, high-confidence data."""
-    df = pd.DataFrame({
-        'CategoryAnnotation': ['Food', 'Transport', 'Utilities'],
-        'SubCategoryAnnotation': ['Coffee', 'Bus', 'Electric'],
-        'Confidence': [0.95, 0.92, 0.88]
+def _annotated(categories, subcategories, confidences) -> pd.DataFrame:
+    return pd.DataFrame({
+        'CategoryAnnotation': categories,
+        'SubCategoryAnnotation': subcategories,
+        'Confidence': confidences,
     })
-    
-    calculator = SimpleQualityCalculator()
-    metrics = calculator.calculate(df)
-    
-    # Average of [0.95, 0.92, 0.88] = 0.9167
-    assert isinstance(metrics, QualityMetrics)
-    assert metrics.overall_quality_index == pytest.approx(0.9167, abs=0.001)
 
 
-def test_default_quality_calculator_with_zero_confidence():
-    """Test that zero confidence makes entire row zero."""
-    df = pd.DataFrame({
-        'CategoryAnnotation': ['Food', 'Transport', 'Utilities'],
-        'SubCategoryAnnotation': ['Coffee', 'Bus', 'Electric'],
-        'Confidence': [0.95, 0.0, 0.88]
-    })
-    
-    calculator = SimpleQualityCalculator()
-    metrics = calculator.calculate(df)
-    
+# Frames are built once at collection; SimpleQualityCalculator never mutates its input
+@pytest.mark.parametrize("df,expected", [
+    # Average of [0.95, 0.92, 0.88] = 0.9167
+    (_annotated(['Food', 'Transport', 'Utilities'], ['Coffee', 'Bus', 'Electric'], [0.95, 0.92, 0.88]), 0.9167),
     # Row 2 has 0 confidence, so it's 0. Average of [0.95, 0, 0.88] = 0.6100
-    assert isinstance(metrics, QualityMetrics)
-    assert metrics.overall_quality_index == pytest.approx(0.6100, abs=0.001)
-
-
-def test_default_quality_calculator_with_missing_category():
-    """Test that missing category makes row zero."""
-    df = pd.DataFrame({
-        'CategoryAnnotation': ['Food', None, 'Utilities'],
-        'SubCategoryAnnotation': ['Coffee', 'Bus', 'Electric'],
-        'Confidence': [0.95, 0.92, 0.88]
-    })
-    
-    calculator = SimpleQualityCalculator()
-    metrics = calculator.calculate(df)
-    
+    (_annotated(['Food', 'Transport', 'Utilities'], ['Coffee', 'Bus', 'Electric'], [0.95, 0.0, 0.88]), 0.6100),
     # Row 2 has missing category, so it's 0. Average of [0.95, 0, 0.88] = 0.6100
-    assert isinstance(metrics, QualityMetrics)
-    assert metrics.overall_quality_index == pytest.approx(0.6100, abs=0.001)
-
-
-def test_default_quality_calculator_with_missing_subcategory():
-    """Test that missing subcategory makes row zero."""
-    df = pd.DataFrame({
-        'CategoryAnnotation': ['Food', 'Transport', 'Utilities'],
-        'SubCategoryAnnotation': ['Coffee', None, 'Electric'],
-        'Confidence': [0.95, 0.92, 0.88]
-    })
-    
-    calculator = SimpleQualityCalculator()
-    metrics = calculator.calculate(df)
-    
+    (_annotated(['Food', None, 'Utilities'], ['Coffee', 'Bus', 'Electric'], [0.95, 0.92, 0.88]), 0.6100),
     # Row 2 has missing subcategory, so it's 0. Average of [0.95, 0, 0.88] = 0.6100
-    assert isinstance(metrics, QualityMetrics)
-    assert metrics.overall_quality_index == pytest.approx(0.6100, abs=0.001)
-
-
-def test_default_quality_calculator_with_low_confidence():
-    """Test calculation with low confidence scores."""
-    df = pd.DataFrame({
-        'CategoryAnnotation': ['Food', 'Transport', 'Utilities'],
-        'SubCategoryAnnotation': ['Coffee', 'Bus', 'Electric'],
-        'Confidence': [0.60, 0.92, 0.88]
-    })
-    
+    (_annotated(['Food', 'Transport', 'Utilities'], ['Coffee', None, 'Electric'], [0.95, 0.92, 0.88]), 0.6100),
+    # Currently using simple average: (0.60 + 0.92 + 0.88) / 3 = 0.8
+    # Note: Weighting logic (low scores having more impact) to be clarified in future
+    (_annotated(['Food', 'Transport', 'Utilities'], ['Coffee', 'Bus', 'Electric'], [0.60, 0.92, 0.88]), (0.60 + 0.92 + 0.88) / 3),
+], ids=["all_valid", "zero_confidence", "missing_category", "missing_subcategory", "low_confidence"])
+def test_default_quality_calculator(df, expected):
+    """Test that invalid rows score zero and the index is the average row score."""
     calculator = SimpleQualityCalculator()
     metrics = calculator.calculate(df)
     
-    # Currently using simple average: (0.60 + 0.92 + 0.88) / 3 = 0.8
-    # Note: Weighting logic (low scores having more impact) to be clarified in future
-    expected = (0.60 + 0.92 + 0.88) / 3
     assert isinstance(metrics, QualityMetrics)
-    assert metrics.overall_quality_index == pytest.approx(expected, abs=0.001)
+    assert math.isclose(metrics.overall_quality_index, expected, abs_tol=0.001)
 
 
 def test_default_quality_calculator_with_empty_dataframe():
@@ -100,3 +50,23 @@ def test_default_quality_calculator_with_empty_dataframe():
     # Empty data should result in 0 quality
     assert isinstance(metrics, QualityMetrics)
     assert metrics.overall_quality_index == 0.0
+    assert metrics is EMPTY_METRICS
+    assert DefaultQualityCalculator().calculate(df) is EMPTY_METRICS
+
+
+def test_default_quality_calculator_dimensions():
+    """Test completeness, weighted confidence and prefix-group consistency together."""
+    df = _annotated(['Food', 'Food', 'Transport', 'Food', 'Income'],
+                    ['Groceries', 'Groceries', 'Taxi', 'Groceries', 'Salary'],
+                    [0.95, 0.80, 0.50, None, 0.90])
+    df['TransactionDescription'] = ['TESCO STORES 01', 'TESCO STORES 02', 'UBER TRIPS 001', 'UBER TRIPS 002', 'SALARY']
+
+    metrics = DefaultQualityCalculator().calculate(df)
+
+    # One row misses Confidence: (4 * 1 + 2/3) / 5
+    assert math.isclose(metrics.completeness, 14 / 15)
+    # Weights 1, 2, 3, 2 for 0.95, 0.80, 0.50, 0.90; the missing row is excluded
+    assert math.isclose(metrics.confidence, (0.95 + 1.6 + 1.5 + 1.8) / 8)
+    # TESCO group agrees, UBER group is mixed, SALARY is not a group
+    assert math.isclose(metrics.consistency, 0.5)
+    assert math.isclose(metrics.overall_quality_index, 0.3 * 14 / 15 + 0.5 * 5.85 / 8 + 0.2 * 0.5)
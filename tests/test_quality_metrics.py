@@ -1,4 +1,6 @@
 """TDD: Tests for QualityMetrics dataclass and quality calculations."""
+import dataclasses
+import pytest
 from analyzer.pipeline.quality import QualityMetrics
 
 
@@ -18,3 +20,12 @@ def test_quality_metrics_to_dict():
     assert result_dict['confidence'] == 0.87
     assert result_dict['consistency'] == 0.92
     assert result_dict['overall_quality_index'] == 0.91
+
+
+def test_quality_metrics_is_immutable():
+    """Test that calculated metrics cannot be changed after the fact."""
+    metrics = QualityMetrics(completeness=0.95, confidence=0.87, consistency=0.92, overall_quality_index=0.91)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metrics.overall_quality_index = 1.0
+    assert not hasattr(metrics, "__dict__")
@@ -42,14 +42,15 @@ def test_quality_analysis_with_missing_data():
     """Test quality analysis with rows missing category information."""
     
     class MixedDataCommand(PipelineCommand):
+        _DATA = pd.DataFrame({
+            'CategoryAnnotation': ['Food', None, 'Utilities'],
+            'SubCategoryAnnotation': ['Coffee', 'Bus', None],
+            'Confidence': [0.95, 0.92, 0.88],
+            'Amount': [5.50, 25.00, 120.00]
+        })
+
         def process(self, df: pd.DataFrame, context=None) -> CommandResult:
-            data = pd.DataFrame({
-                'CategoryAnnotation': ['Food', None, 'Utilities'],
-                'SubCategoryAnnotation': ['Coffee', 'Bus', None],
-                'Confidence': [0.95, 0.92, 0.88],
-                'Amount': [5.50, 25.00, 120.00]
-            })
-            return CommandResult(return_code=0, data=data)
+            return CommandResult(return_code=0, data=self._DATA.copy())
     
     commands = [
         MixedDataCommand(),
@@ -77,13 +78,14 @@ def test_quality_analysis_captures_all_metrics():
     """Test that full quality metrics are captured in metadata."""
     
     class SimpleDataCommand(PipelineCommand):
+        _DATA = pd.DataFrame({
+            'CategoryAnnotation': ['Food', 'Transport'],
+            'SubCategoryAnnotation': ['Coffee', 'Bus'],
+            'Confidence': [0.95, 0.92]
+        })
+
         def process(self, df: pd.DataFrame, context=None) -> CommandResult:
-            data = pd.DataFrame({
-                'CategoryAnnotation': ['Food', 'Transport'],
-                'SubCategoryAnnotation': ['Coffee', 'Bus'],
-                'Confidence': [0.95, 0.92]
-            })
-            return CommandResult(return_code=0, data=data)
+            return CommandResult(return_code=0, data=self._DATA.copy())
     
     commands = [
         SimpleDataCommand(),
@@ -117,13 +119,14 @@ def test_quality_analysis_with_low_confidence_data():
     """Test quality analysis with consistently low confidence scores."""
     
     class LowConfidenceCommand(PipelineCommand):
+        _DATA = pd.DataFrame({
+            'CategoryAnnotation': ['Food', 'Transport', 'Utilities'],
+            'SubCategoryAnnotation': ['Coffee', 'Bus', 'Gas'],
+            'Confidence': [0.45, 0.52, 0.48]
+        })
+
         def process(self, df: pd.DataFrame, context=None) -> CommandResult:
-            data = pd.DataFrame({
-                'CategoryAnnotation': ['Food', 'Transport', 'Utilities'],
-                'SubCategoryAnnotation': ['Coffee', 'Bus', 'Gas'],
-                'Confidence': [0.45, 0.52, 0.48]
-            })
-            return CommandResult(return_code=0, data=data)
+            return CommandResult(return_code=0, data=self._DATA.copy())
     
     commands = [
         LowConfidenceCommand(),
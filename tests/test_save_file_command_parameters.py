@@ -1,64 +1,74 @@
 """Test that SaveFileCommand captures output file path in parameters."""
 import pytest
 import pandas as pd
-import tempfile
 from pathlib import Path
 from analyzer.pipeline.pipeline_commands import DataPipeline, SaveFileCommand
 from analyzer.pipeline.metadata import MetadataCollector
 
 
-def test_save_file_command_captures_file_path_in_parameters():
+def test_save_file_command_captures_file_path_in_parameters(tmp_path):
     """Test that SaveFileCommand saves the full absolute path in step parameters."""
     
     # Create test data
     df = pd.DataFrame({"col": [1, 2, 3]})
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_file = Path(tmpdir) / "test_output.csv"
-        
-        collector = MetadataCollector(pipeline_name="test_pipeline")
-        pipeline = DataPipeline(
-            [SaveFileCommand(output_path=str(output_file))],
-            collector=collector
-        )
-        
-        # Run pipeline
-        result_df = pipeline.run(df)
-        
-        # Get metadata
-        metadata = collector.get_pipeline_metadata()
-        
-        # Verify file was saved
-        assert output_file.exists()
-        
-        # Verify parameters contain file path
-        assert len(metadata.steps) == 1
-        step = metadata.steps[0]
-        assert step.parameters is not None
-        assert "output_file_path" in step.parameters
-        assert step.parameters["output_file_path"] == str(output_file.absolute())
+    output_file = tmp_path / "test_output.csv"
+    
+    collector = MetadataCollector(pipeline_name="test_pipeline")
+    pipeline = DataPipeline(
+        [SaveFileCommand(output_path=str(output_file))],
+        collector=collector
+    )
+    
+    # Run pipeline
+    result_df = pipeline.run(df)
+    
+    # Get metadata
+    metadata = collector.get_pipeline_metadata()
+    
+    # Verify file was saved
+    assert output_file.exists()
+    
+    # Verify parameters contain file path
+    assert len(metadata.steps) == 1
+    step = metadata.steps[0]
+    assert step.parameters is not None
+    assert "output_file_path" in step.parameters
+    assert step.parameters["output_file_path"] == str(output_file.absolute())
 
 
-def test_save_file_command_file_path_is_absolute():
+def test_save_file_command_file_path_is_absolute(tmp_path):
     """Test that the saved file path is absolute."""
     
     df = pd.DataFrame({"col": [1, 2, 3]})
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_file = Path(tmpdir) / "test_output.csv"
-        
-        collector = MetadataCollector(pipeline_name="test_pipeline")
-        pipeline = DataPipeline(
-            [SaveFileCommand(output_path=str(output_file))],
-            collector=collector
-        )
-        
-        # Run pipeline
-        pipeline.run(df)
-        
-        # Get metadata
-        metadata = collector.get_pipeline_metadata()
-        
-        # Verify file path is absolute
-        saved_path = metadata.steps[0].parameters["output_file_path"]
-        assert Path(saved_path).is_absolute()
+    output_file = tmp_path / "test_output.csv"
+    
+    collector = MetadataCollector(pipeline_name="test_pipeline")
+    pipeline = DataPipeline(
+        [SaveFileCommand(output_path=str(output_file))],
+        collector=collector
+    )
+    
+    # Run pipeline
+    pipeline.run(df)
+    
+    # Get metadata
+    metadata = collector.get_pipeline_metadata()
+    
+    # Verify file path is absolute
+    saved_path = metadata.steps[0].parameters["output_file_path"]
+    assert Path(saved_path).is_absolute()
+
+
+def test_save_file_command_resolves_relative_path_at_construction(tmp_path, monkeypatch):
+    """Test that a relative output path is pinned to the cwd the command was built in."""
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path)
+    command = SaveFileCommand(output_path="out/result.csv")
+    monkeypatch.chdir(tmp_path / "elsewhere")
+
+    result = command.process(pd.DataFrame({"col": [1]}))
+
+    assert (tmp_path / "out" / "result.csv").exists()
+    assert result.metadata_updates["output_file_path"] == str((tmp_path / "out" / "result.csv").resolve())
@@ -46,3 +46,10 @@ def test_step_metadata_to_dict():
     assert metadata_dict["parameters"]["on_columns"] == ["TransactionNumber"]
     assert "start_time" in metadata_dict
     assert "end_time" in metadata_dict
+
+
+def test_step_metadata_uses_slots():
+    """Test that StepMetadata carries no per-instance __dict__."""
+    metadata = StepMetadata("Step1", input_rows=0, output_rows=1, duration=0.1, parameters={})
+
+    assert not hasattr(metadata, "__dict__")